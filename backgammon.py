@@ -30,6 +30,8 @@
 
 
 import argparse
+import cProfile
+import functools
 import importlib
 import logging
 import sys
@@ -38,22 +40,49 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--no-gui', '-n', action='store_true')
     parser.add_argument('--verbose', '-v', action='store_true')
+    parser.add_argument('--synchronous', '-S', action='store_true',
+            help='play headless games turn by turn without threads')
+    parser.add_argument('--stats', action='store_true',
+            help='log search counters of min_max bots after every move')
+    parser.add_argument('--profile', metavar='FILE',
+            help='dump cProfile stats of the game to FILE, headless games '
+            'are played synchronously so that bots are profiled too')
     parser.add_argument('--white', '-w')
     parser.add_argument('--black', '-b')
     args = parser.parse_args()
 
+    def load_bot(name):
+        bot = importlib.import_module(name).Bot
+
+        if args.stats:
+            import backgammon.bots.min_max as min_max
+            if issubclass(bot, min_max.Bot):
+                bot = functools.partial(bot, stats=True)
+
+        return bot
+
     if args.no_gui:
         from backgammon.judge.main import main
     else:
         from backgammon.gui.main import main
 
     if args.white:
-        args.white = importlib.import_module(args.white).Bot
+        args.white = load_bot(args.white)
 
     if args.black:
-        args.black = importlib.import_module(args.black).Bot
+        args.black = load_bot(args.black)
 
     if args.verbose:
         logging.basicConfig(level=logging.DEBUG)
+    elif args.stats:
+        logging.basicConfig(level=logging.INFO)
 
-    main(**vars(args))
+    if args.profile:
+        if args.no_gui:
+            args.synchronous = True
+
+        profile = cProfile.Profile()
+        profile.runcall(main, **vars(args))
+        profile.dump_stats(args.profile)
+    else:
+        main(**vars(args))
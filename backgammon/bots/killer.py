@@ -28,10 +28,13 @@
 
 import backgammon.bots.min_max as min_max
 
+import backgammon.bots.utils.batch_tactics as batch_tactics
 import backgammon.bots.utils.tactics as tactics
 
 
 class Bot(min_max.Bot):
+    bounds = tactics.bounds([tactics.tactic_killer])
+
     def __init__(self, player, *args, **kwargs):
         super().__init__(player, *args, **kwargs)
 
@@ -39,3 +42,8 @@ class Bot(min_max.Bot):
         player = self._player.color
 
         return tactics.tactic_killer(board, player)
+
+    def evaluate_batch(self, boards):
+        player = self._player.color
+
+        return batch_tactics.tactic_killer(boards, player)
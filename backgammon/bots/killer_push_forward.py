@@ -28,10 +28,16 @@
 
 import backgammon.bots.min_max as min_max
 
+import backgammon.bots.utils.batch_tactics as batch_tactics
 import backgammon.bots.utils.tactics as tactics
 
 
 class Bot(min_max.Bot):
+    bounds = tactics.bounds([
+        tactics.tactic_killer,
+        tactics.tactic_push_forward,
+    ])
+
     def __init__(self, player, *args, **kwargs):
         super().__init__(player, *args, **kwargs)
 
@@ -40,3 +46,9 @@ class Bot(min_max.Bot):
 
         return tactics.tactic_killer(board, player) \
             + tactics.tactic_push_forward(board, player)
+
+    def evaluate_batch(self, boards):
+        player = self._player.color
+
+        return batch_tactics.tactic_killer(boards, player) \
+            + batch_tactics.tactic_push_forward(boards, player)
@@ -26,23 +26,123 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import collections
+import logging
+import math
+import random
 import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+import backgammon.bots.utils.batch_tactics as batch_tactics
+import backgammon.bots.utils.bearoff as bearoff
+import backgammon.bots.utils.tactics as tactics
 
 from backgammon.bots.utils.minmax import MinMax
+from backgammon.bots.utils.stats import SearchStats
+from backgammon.bots.utils.transposition import TranspositionTable
+
+from backgammon.model.utils import enemy
+from backgammon.model.utils import unique_available_moves
+
+log = logging.getLogger('MinMaxBot')
+
+# stands in for Game.Player in copies of a bot sent to worker processes
+_DetachedPlayer = collections.namedtuple('_DetachedPlayer', ['color'])
+
+_worker_bot = None
+
 
-from backgammon.model.utils import available_moves
+def _init_worker(bot):
+    global _worker_bot
+    _worker_bot = bot
+
+
+def _search_candidate(board, seed):
+    return _worker_bot.search(board, seed)
 
 
 class Bot:
-    def __init__(self, player, threaded=True):
+    # lowest and highest value of evaluate, enables chance node pruning
+    bounds = None
+
+    def __init__(self, player, threaded=True, levels=1, table_size=2**18,
+            expansion_size=2**16, workers=None, seed=None, stats=False,
+            time_budget=None, node_budget=None, beam_width=None,
+            beam_levels=0, bear_off=True, race=True):
         self._player = player
-        self.min_max = MinMax(evaluate=self.evaluate, levels=1)
         self._threaded = threaded
+        self._levels = levels
+        # with a budget levels is the deepest search tried
+        self._time_budget = time_budget
+        self._node_budget = node_budget
+        # only the beam_width best candidates according to a beam_levels deep
+        # search are searched levels deep
+        self._beam_width = beam_width
+        self._beam_levels = beam_levels
+        # table_size caps the entries of the transposition table and
+        # expansion_size the boards kept in the expansions cache, both hold
+        # a board of about 500 bytes per unit, so the defaults take up to
+        # about 130 and 35 MB, neither is hit much below 2 levels
+        self._table_size = table_size
+        self._expansion_size = expansion_size
+        # races where both players bear off are valued by the bear-off
+        # database when it has been generated
+        self._bear_off = bear_off
+        # other positions without contact are valued from the pip counts
+        self._race_evaluation = race
+        self._workers = workers
+        self._seed = seed
+        self._executor = None
+        self._turn = 0
+
+        # counters of the last select_move call, searches done in worker
+        # processes are not counted
+        self.stats = SearchStats() if stats else None
+
+        self._init_search()
+
+        self._player.subscribe_turns(self.turn_started)
+
+    def _init_search(self):
+        self.table = TranspositionTable(self._table_size) \
+            if self._table_size else None
+        self.expansions = TranspositionTable(self._expansion_size,
+                weigh=len) if self._expansion_size else None
+        self.bear_off = bearoff.load() if self._bear_off else None
+        self.min_max = MinMax(evaluate=self.evaluate, levels=self._levels,
+                player=self._player.color, bounds=self.bounds,
+                table=self.table, evaluate_batch=self._get_evaluate_batch(),
+                stats=self.stats, expansions=self.expansions,
+                race=self._race if self.bear_off is not None
+                    or self._race_evaluation else None)
 
-        self._player.add_observer(self)
+    def _get_evaluate_batch(self):
+        if not batch_tactics.available() \
+                or type(self).evaluate_batch is Bot.evaluate_batch:
+            return None
 
-    def update(self, observable):
-        assert observable is self._player
+        def evaluate_batch(boards):
+            return self.evaluate_batch(batch_tactics.as_array(boards))
+
+        return evaluate_batch
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_player'] = _DetachedPlayer(self._player.color)
+        state['_executor'] = None
+        del state['table']
+        del state['expansions']
+        del state['bear_off']
+        del state['min_max']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_search()
+
+    def turn_started(self, event):
         if not self._player.is_active():
             return
 
@@ -59,17 +159,185 @@ class Bot:
         dice = self._player.dice
         color = self._player.color
 
+        selected_move = self.select_move(board, dice, color)
+
+        self._player.play_turn(selected_move)
+
+    def select_move(self, board, dice, color):
+        # the time budget covers the whole move, not only the deep search
+        deadline = None if self._time_budget is None \
+            else time.perf_counter() + self._time_budget
+
+        stats = self.stats
+        if stats is not None:
+            stats.reset()
+            started = stats.timer()
+
+        candidates = list(unique_available_moves(board, dice, color))
+        boards = [b for _, b in candidates]
+
+        if stats is not None:
+            stats.generation_time += stats.timer() - started
+            stats.moves += len(candidates)
+
+        if self._seed is None:
+            seeds = [None] * len(boards)
+        else:
+            seeds = ['{}:{}:{}'.format(self._seed, self._turn, i)
+                    for i in range(len(boards))]
+        self._turn += 1
+
+        shortlist = self._shortlist(boards, seeds)
+        boards = [boards[i] for i in shortlist]
+        seeds = [seeds[i] for i in shortlist]
+
+        if self._time_budget is not None or self._node_budget is not None:
+            selected = self._deepen(boards, seeds, deadline)
+        else:
+            selected = self._select(boards, seeds)
+
+        selected_move = candidates[shortlist[selected]][0]
+
+        if stats is not None:
+            stats.total_time = stats.timer() - started
+            log.info('{}: {}'.format(color, stats))
+
+        return selected_move
+
+    # indices of the candidates worth a deep search, best first
+    def _shortlist(self, boards, seeds):
+        indices = list(range(len(boards)))
+        if self._beam_width is None or len(boards) <= self._beam_width:
+            return indices
+
+        values = self._score(boards, seeds, self._beam_levels)
+        indices.sort(key=lambda i: -values[i])
+        return indices[:self._beam_width]
+
+    # exact values of all candidates searched levels deep
+    def _score(self, boards, seeds, levels):
+        min_max = self.min_max
+        if levels == 0 and min_max.evaluate_batch is not None:
+            return [float(value) for value in min_max.evaluate_leaves(boards,
+                    enemy(self._player.color))]
+
+        min_max.levels = levels
+        try:
+            return [self.search(b, seed) for b, seed in zip(boards, seeds)]
+        finally:
+            min_max.levels = self._levels
+
+    def _select(self, boards, seeds):
+        if self._levels == 0 and self.min_max.evaluate_batch is not None:
+            values = self.min_max.evaluate_leaves(boards,
+                    enemy(self._player.color))
+        elif self._workers and len(boards) > 1:
+            values = list(self._get_executor().map(_search_candidate, boards,
+                    seeds))
+        else:
+            values = None
+
         mx = None
-        selected_move = None
+        selected = None
+
+        for i, b in enumerate(boards):
+            if values is None:
+                # candidates not better than the best one so far are cut off
+                value = self.search(b, seeds[i],
+                        -math.inf if mx is None else mx)
+            else:
+                value = values[i]
 
-        for h, b in available_moves(board, dice, color):
-            value = self.min_max.maximize(b)
             if mx is None or value > mx:
                 mx = value
-                selected_move = h
+                selected = i
+
+        return selected
+
+    # iterative deepening, searches one level deeper at a time until the
+    # budget runs out or the deadline passes and returns the index of the best
+    # candidate found so far
+    def _deepen(self, boards, seeds, deadline=None):
+        min_max = self.min_max
+        order = list(range(len(boards)))
+        selected = 0
+
+        min_max.set_budget(None if deadline is None
+                else deadline - time.perf_counter(), self._node_budget)
+        try:
+            # level 0 only evaluates candidates, so it always completes
+            for levels in range(self._levels + 1):
+                min_max.levels = levels
+                values = {}
+                mx = None
+                best = None
 
-        for position, distance in selected_move:
-            self._player.move(position, distance)
+                # the best candidate of the previous level goes first, so the
+                # best one of an unfinished level is never worse than it
+                for i in order:
+                    value = self.search(boards[i], seeds[i],
+                            -math.inf if mx is None else mx)
+                    values[i] = value
+
+                    if mx is None or value > mx:
+                        mx = value
+                        best = i
+
+                selected = best
+                order.sort(key=lambda i: -values[i])
+        except MinMax.Timeout:
+            if best is not None:
+                selected = best
+            log.debug('budget exceeded at level {}'.format(levels))
+        finally:
+            min_max.levels = self._levels
+            min_max.set_budget()
+
+        return selected
+
+    # value of a race mapped onto the range of evaluate, None when there is
+    # still contact
+    def _race(self, board, to_move):
+        color = self._player.color
+        chance = None
+
+        if self.bear_off is not None:
+            chance = self.bear_off.winning_chance(board, color, to_move)
+        if chance is None and self._race_evaluation \
+                and not board.has_contact():
+            chance = tactics.race(board, color, to_move)
+        if chance is None:
+            return None
+
+        low, high = self.bounds or (-1, 1)
+        return low + (chance + 1) * (high - low) / 2
+
+    def search(self, board, seed=None, alpha=-math.inf):
+        if seed is None:
+            return self.min_max.maximize(board, alpha)
+
+        # seed per candidate so results do not depend on how candidates are
+        # spread over workers, without disturbing the caller's dice rolls
+        state = random.getstate()
+        random.seed(seed)
+        try:
+            return self.min_max.maximize(board, alpha)
+        finally:
+            random.setstate(state)
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers,
+                    initializer=_init_worker, initargs=(self,))
+        return self._executor
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def evaluate(self, board):
         pass
+
+    def evaluate_batch(self, boards):
+        pass
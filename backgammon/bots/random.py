@@ -30,7 +30,8 @@ import logging
 import random
 import threading
 
-from backgammon.model.game import Game
+from backgammon.model.utils import legal_moves
+from backgammon.model.utils import make_move
 
 log = logging.getLogger('RandomBot')
 
@@ -39,21 +40,31 @@ class Bot:
     def __init__(self, player):
         self._player = player
 
-        self._player.add_observer(self)
+        self._player.subscribe_turns(self.turn_started)
 
-    def update(self, player):
-        assert player is self._player
+    def turn_started(self, event):
         threading.Thread(target=self.move).start()
 
     def move(self):
-        while self._player.is_active() and not self.try_to_move():
-            pass
-
-    def try_to_move(self):
-        try:
-            position = random.randint(0, 25)
-            distance = random.randint(1, 6)
-            self._player.move(position, distance)
-        except Game.LogicError:
-            return False
-        return True
+        if not self._player.is_active():
+            return
+
+        self._player.play_turn(self.select_move(self._player.board,
+                self._player.dice, self._player.color,
+                self._player.legal_moves))
+
+    # random legal moves played one after another until the turn is over,
+    # first_moves are the legal moves of board when they are already known
+    def select_move(self, board, dice, color, first_moves=None):
+        moves = []
+        legal = legal_moves(board, dice, color) if first_moves is None \
+            else first_moves
+
+        while legal:
+            position, distance = random.choice(legal)
+            board = make_move(board, position, distance, color)
+            dice.remove(distance)
+            moves.append((position, distance))
+            legal = legal_moves(board, dice, color)
+
+        return moves
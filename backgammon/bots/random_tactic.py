@@ -30,6 +30,7 @@ import random
 
 import backgammon.bots.min_max as min_max
 
+import backgammon.bots.utils.batch_tactics as batch_tactics
 import backgammon.bots.utils.tactics as tactics
 
 
@@ -43,6 +44,16 @@ class Bot(min_max.Bot):
                 random.randint(1, len(available_tactics)))
 
         self.tactics = [vars(tactics)[k] for k in selected_tactics]
+        self.bounds = tactics.bounds(self.tactics)
+
+        if tactics.tactic_random in self.tactics:
+            # cached random values would depend on the search order
+            self._table_size = None
+
+        self._init_search()
+
+        self.name = '{}[{}]'.format(__name__,
+                ','.join(sorted(selected_tactics)))
 
         print(player.color, sorted(selected_tactics))
 
@@ -54,3 +65,12 @@ class Bot(min_max.Bot):
             result += tactic(board, player)
 
         return result
+
+    def evaluate_batch(self, boards):
+        player = self._player.color
+        result = 0
+
+        for tactic in self.tactics:
+            result += vars(batch_tactics)[tactic.__name__](boards, player)
+
+        return result
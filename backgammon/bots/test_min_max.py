@@ -0,0 +1,102 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import time
+import unittest
+
+import backgammon.bots.killer_push_forward as killer_push_forward
+
+from backgammon.model.game import Game
+from backgammon.model.utils import unique_available_moves
+
+
+class TestBot(unittest.TestCase):
+    def select_move(self, **kwargs):
+        game = Game(_starting_player='w')
+        bot = killer_push_forward.Bot(game.get_player('w'), threaded=False,
+                seed=7, **kwargs)
+        try:
+            return bot.select_move(game.board, (6, 5), 'w')
+        finally:
+            bot.close()
+
+    def test_workers_select_same_move(self):
+        self.assertEqual(self.select_move(), self.select_move(workers=2))
+
+    def test_unlimited_budget_selects_same_move(self):
+        self.assertEqual(self.select_move(levels=1),
+                self.select_move(levels=1, node_budget=10**9))
+
+    def test_exhausted_budget_falls_back_to_evaluation(self):
+        self.assertEqual(self.select_move(levels=0, node_budget=0),
+                self.select_move(levels=2, node_budget=0))
+
+    def test_wide_beam_selects_same_move(self):
+        self.assertEqual(self.select_move(levels=1),
+                self.select_move(levels=1, beam_width=100))
+
+    def test_single_candidate_beam_selects_best_evaluated_move(self):
+        self.assertEqual(self.select_move(levels=0, beam_width=1),
+                self.select_move(levels=1, beam_width=1))
+
+    def test_batched_candidates_value_races(self):
+        # some of white's moves pass the last black checker
+        board = [0] * 26
+        board[20] = 1
+        board[22] = 7
+        board[23] = 7
+        board[21] = -1
+        board[3] = -14
+        game = Game(_starting_player='w', _board=board)
+        bot = killer_push_forward.Bot(game.get_player('w'), threaded=False,
+                levels=0, bear_off=False)
+
+        boards = [b for _, b in unique_available_moves(game.board, (2, 1),
+                'w')]
+        values = bot._score(boards, [None] * len(boards), 0)
+
+        self.assertEqual(len(set(b.has_contact() for b in boards)), 2)
+        for b, value in zip(boards, values):
+            self.assertAlmostEqual(value, bot.search(b))
+
+    def test_time_budget_covers_whole_move(self):
+        game = Game(_starting_player='w')
+        bot = killer_push_forward.Bot(game.get_player('w'), threaded=False,
+                levels=2, time_budget=0.5)
+        shortlist = bot._shortlist
+
+        def slow_shortlist(boards, seeds):
+            time.sleep(0.6)
+            return shortlist(boards, seeds)
+
+        bot._shortlist = slow_shortlist
+
+        # only the evaluation of the candidates fits into what is left
+        with self.assertLogs('MinMaxBot', 'DEBUG') as logs:
+            bot.select_move(game.board, (6, 5), 'w')
+        self.assertIn('budget exceeded at level 1', logs.output[-1])
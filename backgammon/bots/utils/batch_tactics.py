@@ -0,0 +1,84 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import functools
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from backgammon.model.utils import player_modifier
+from backgammon.model.utils import jail_field
+from backgammon.model.utils import enemy
+
+
+def available():
+    return np is not None
+
+
+def as_array(boards):
+    return np.array([tuple(board) for board in boards], dtype=np.int64) \
+        .reshape(-1, 26)
+
+
+@functools.lru_cache(maxsize=None)
+def _push_forward_weights(player):
+    modifier = player_modifier(player)
+    return np.array([((26 + modifier * i) % 26) / 28 for i in range(26)])
+
+
+def tactic_killer(boards, player):
+    return (boards[:, jail_field(enemy(player))]
+        - boards[:, jail_field(player)]) / 15
+
+
+def tactic_push_forward(boards, player):
+    weights = _push_forward_weights(player)
+
+    # checkers of both players are weighted with the same distance, the
+    # player's ones added and the enemy's ones subtracted
+    push_forward = player_modifier(player) * (np.abs(boards) @ weights)
+    push_forward -= boards.sum(axis=1)
+
+    return push_forward / 15
+
+
+def tactic_doors(boards, player):
+    modifier = player_modifier(player)
+    fields = boards[:, 1:25]
+
+    player_singles = (fields == modifier).sum(axis=1)
+    enemy_singles = (fields == -modifier).sum(axis=1)
+
+    return -(player_singles - enemy_singles) / 15
+
+
+def tactic_random(boards, player):
+    return np.array([random.random() * 2 - 1 for _ in range(len(boards))])
@@ -0,0 +1,256 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import argparse
+import itertools as it
+import logging
+import math
+import mmap
+import os
+import struct
+import time
+
+from backgammon.model.board import Board
+from backgammon.model.utils import DICE_OUTCOMES
+from backgammon.model.utils import enemy
+
+log = logging.getLogger('BearOff')
+
+# One-sided bear-off database: the expected number of turns a player needs to
+# bear off from every position of up to 15 checkers in their home board,
+# playing to minimize it. A checker may bear off with any die not smaller
+# than its distance and doubles are played four times, as in the model.
+#
+# A position is given as the numbers of checkers 1 to 6 pips away from being
+# borne off. Such counts are 6 bars among 21 places, the other places being
+# checkers on the points and off the board, so positions are indexed by the
+# combinatorial number system.
+
+POINTS = 6
+CHECKERS = 15
+
+PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bearoff.db')
+
+_MAGIC = b'BGBO'
+_HEADER = struct.Struct('<4sII')
+_VALUE = struct.Struct('<f')
+
+_COMB = [[math.comb(n, k) for k in range(POINTS + 1)]
+    for n in range(CHECKERS + POINTS + 1)]
+
+
+def index(counts):
+    result = 0
+    place = -1
+    for k, count in enumerate(counts, 1):
+        place += count + 1
+        result += _COMB[place][k]
+    return result
+
+
+# positions of fewer checkers come first, so tables of fewer checkers are
+# prefixes of the full one
+def size(checkers=CHECKERS):
+    return math.comb(checkers + POINTS, POINTS)
+
+
+def positions(checkers=CHECKERS):
+    for counts in it.product(range(checkers + 1), repeat=POINTS):
+        if sum(counts) <= checkers:
+            yield counts
+
+
+# counts of the checkers of player when all of them are in their home board,
+# None otherwise
+def home_counts(board, player):
+    fields = board.fields if isinstance(board, Board) else board
+
+    if player == 'w':
+        if fields[0] > 0 or not _is_home(board, 'w'):
+            return None
+        return tuple(max(fields[25 - i], 0) for i in range(1, POINTS + 1))
+
+    if fields[25] < 0 or not _is_home(board, 'b'):
+        return None
+    return tuple(max(-fields[i], 0) for i in range(1, POINTS + 1))
+
+
+def _is_home(board, player):
+    if isinstance(board, Board):
+        return board.is_home(player)
+    if player == 'w':
+        return all(k <= 0 for k in board[1:19])
+    return all(k >= 0 for k in board[7:25])
+
+
+def _moves(counts, die):
+    result = set()
+    for i, count in enumerate(counts):
+        if count:
+            new_counts = list(counts)
+            new_counts[i] -= 1
+            if i >= die:
+                new_counts[i - die] += 1
+            result.add(tuple(new_counts))
+    return result
+
+
+def generate(checkers=CHECKERS):
+    # every move lowers the pip count, so positions are solved in its order
+    order = sorted(positions(checkers),
+            key=lambda counts: sum(k * c for k, c in enumerate(counts, 1)))
+
+    turns = [0.0] * size(checkers)
+    # best[n][i][die - 1] is the least expected number of turns left after
+    # n + 1 moves of die from the position of index i, up to the three moves
+    # left of a double after the first one
+    best = [[None] * len(turns) for _ in range(3)]
+    empty = (0, ) * POINTS
+
+    for counts in order:
+        i = index(counts)
+        if counts == empty:
+            for table in best:
+                table[i] = [0.0] * POINTS
+            continue
+
+        moves = [[index(c) for c in _moves(counts, die)]
+            for die in range(1, POINTS + 1)]
+
+        one = [min(turns[j] for j in moves[die]) for die in range(POINTS)]
+        best[0][i] = one
+        for n in range(1, len(best)):
+            best[n][i] = [min(best[n - 1][j][die] for j in moves[die])
+                for die in range(POINTS)]
+
+        expected = 1.0
+        for dices, probability in DICE_OUTCOMES:
+            if len(dices) == 4:
+                die = dices[0] - 1
+                left = min(best[-1][j][die] for j in moves[die])
+            else:
+                first, second = dices[0] - 1, dices[1] - 1
+                left = min(
+                    min(best[0][j][second] for j in moves[first]),
+                    min(best[0][j][first] for j in moves[second]))
+            expected += probability * left
+        turns[i] = expected
+
+    return turns
+
+
+def save(turns, path=PATH, checkers=CHECKERS):
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as output:
+        output.write(_HEADER.pack(_MAGIC, checkers, len(turns)))
+        for value in turns:
+            output.write(_VALUE.pack(value))
+    os.replace(temporary, path)
+
+
+class Database:
+    def __init__(self, path=PATH):
+        with open(path, 'rb') as database:
+            self._buffer = mmap.mmap(database.fileno(), 0,
+                    access=mmap.ACCESS_READ)
+
+        if len(self._buffer) < _HEADER.size:
+            self._buffer.close()
+            raise ValueError('{} is not a bear-off database'.format(path))
+
+        magic, self.checkers, entries = _HEADER.unpack_from(self._buffer)
+        if magic != _MAGIC or not 0 <= self.checkers <= CHECKERS \
+                or entries != size(self.checkers) \
+                or len(self._buffer) != _HEADER.size + entries * _VALUE.size:
+            self._buffer.close()
+            raise ValueError('{} is not a bear-off database'.format(path))
+
+    # None for positions of more checkers than the database covers
+    def expected_turns(self, counts):
+        if sum(counts) > self.checkers:
+            return None
+        return _VALUE.unpack_from(self._buffer,
+                _HEADER.size + index(counts) * _VALUE.size)[0]
+
+    # chance of player winning a race where both players bear off, between -1
+    # and 1, None when one of them is not bearing off yet
+    def winning_chance(self, board, player, to_move):
+        counts = home_counts(board, player)
+        enemy_counts = home_counts(board, enemy(player))
+        if counts is None or enemy_counts is None:
+            return None
+
+        turns = self.expected_turns(counts)
+        enemy_turns = self.expected_turns(enemy_counts)
+        if turns is None or enemy_turns is None:
+            return None
+
+        if turns == 0:
+            return 1.0
+        if enemy_turns == 0:
+            return -1.0
+
+        # a rough estimate, the player to move is half a turn ahead
+        margin = enemy_turns - turns + (0.5 if to_move == player else -0.5)
+        return math.tanh(margin)
+
+    def close(self):
+        self._buffer.close()
+
+
+_databases = {}
+
+
+# the database at path, None when it has not been generated or cannot be read
+def load(path=PATH):
+    if path not in _databases:
+        try:
+            _databases[path] = Database(path)
+        except FileNotFoundError:
+            log.info('no bear-off database at {}, generate it with '
+                    'python -m backgammon.bots.utils.bearoff'.format(path))
+            _databases[path] = None
+        except (OSError, ValueError, struct.error) as e:
+            log.warning('cannot read bear-off database at {}, regenerate it '
+                    'with python -m backgammon.bots.utils.bearoff: {}'.format(
+                        path, e))
+            _databases[path] = None
+    return _databases[path]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--output', '-o', default=PATH)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    started = time.perf_counter()
+    save(generate(), args.output)
+    log.info('{} positions in {:.1f}s'.format(size(),
+            time.perf_counter() - started))
@@ -26,38 +26,299 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import itertools as it
+import math
+import time
 
-from backgammon.model.utils import player_from_number
-from backgammon.model.utils import available_moves
+from backgammon.model.board import Board
+from backgammon.model.utils import DICE_OUTCOMES
+from backgammon.model.utils import enemy
+from backgammon.model.utils import unique_available_moves
 
+# how a value stored in the transposition table relates to the real one
+EXACT, LOWER, UPPER = range(3)
 
+
+# Expectiminimax with Star1 and Star2 chance node pruning. Values are given
+# from the point of view of player, whose moves are maximized and the enemy's
+# minimized. bounds are the lowest and the highest value evaluate can return,
+# chance nodes are pruned only when they are known.
 class MinMax:
-    def __init__(self, evaluate, levels):
+    class Timeout(Exception):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+
+    def __init__(self, evaluate, levels, player='w', bounds=None, table=None,
+            evaluate_batch=None, stats=None, pruning=True, expansions=None,
+            race=None):
         self.evaluate = evaluate
+        self.evaluate_batch = evaluate_batch
         self.levels = levels
+        self.player = player
+        self.bounds = bounds
+        self.table = table
+        # maps (board, dices, to_move) to the boards reachable by the move
+        self.expansions = expansions
+        # race(board, to_move) values positions without searching them, it
+        # returns None for positions it does not know
+        self.race = race
+        self.stats = stats
+        self.pruning = pruning and bounds is not None
 
-    def maximize(self, board, level=0, previous_value=None):
-        modifier = 1 if level % 2 == 0 else -1
-        if level == self.levels:
-            return self.evaluate(board)
+        self.set_budget()
+
+    # searches raise MinMax.Timeout once they run for longer than time_budget
+    # seconds or expand more than node_budget chance nodes from now on
+    def set_budget(self, time_budget=None, node_budget=None):
+        self._deadline = None if time_budget is None \
+                else time.perf_counter() + time_budget
+        self._node_budget = node_budget
+        self._budgeted = time_budget is not None or node_budget is not None
+        self.expanded = 0
+
+    def _check_budget(self):
+        self.expanded += 1
+        if self._node_budget is not None \
+                and self.expanded > self._node_budget:
+            raise MinMax.Timeout('node budget exceeded')
+        if self._deadline is not None \
+                and time.perf_counter() > self._deadline:
+            raise MinMax.Timeout('time budget exceeded')
+
+    # value of board after a move of player, exact when strictly between
+    # alpha and beta, otherwise an upper (<= alpha) or lower (>= beta) bound
+    def maximize(self, board, alpha=-math.inf, beta=math.inf):
+        if not isinstance(board, Board):
+            board = Board(board)
+        return self._chance(board, self.levels, enemy(self.player), alpha,
+                beta)
+
+    def _chance(self, board, depth, to_move, alpha, beta):
+        if self.race is not None:
+            value = self.race(board, to_move)
+            if value is not None:
+                return value
+
+        if depth == 0:
+            return self._evaluate(board)
+
+        stats = self.stats
+        table = self.table
+
+        if table is not None:
+            key = (board, depth, to_move)
+            entry = table.get(key)
+            if entry is not None:
+                value, flag = entry
+                if flag == EXACT or flag == LOWER and value >= beta \
+                        or flag == UPPER and value <= alpha:
+                    if stats is not None:
+                        stats.table_hits += 1
+                    return value
+
+        if self._budgeted:
+            self._check_budget()
+
+        if stats is not None:
+            stats.nodes += 1
+
+        if depth == 1 and self.evaluate_batch is not None:
+            value = self._chance_leaves(board, to_move)
+        else:
+            value = self._chance_search(board, depth, to_move, alpha, beta)
+
+        if table is not None:
+            if value <= alpha:
+                flag = UPPER
+            elif value >= beta:
+                flag = LOWER
+            else:
+                flag = EXACT
+            table.put(key, (value, flag))
+
+        return value
+
+    def _chance_search(self, board, depth, to_move, alpha, beta):
+        maximizing = to_move == self.player
+        outcomes = [(probability, self._children(board, dices, to_move))
+            for dices, probability in DICE_OUTCOMES]
+
+        if not self.pruning:
+            return sum(probability * self._choose(children, depth, to_move,
+                    -math.inf, math.inf)
+                for probability, children in outcomes)
+
+        lower, upper = self.bounds
+        lows = [lower] * len(outcomes)
+        highs = [upper] * len(outcomes)
+        probes = []
+
+        # Star2: the first child of every outcome bounds its value from one
+        # side, these probes are exact and reused by the full search below
+        for i, (probability, children) in enumerate(outcomes):
+            probe = self._chance(children[0], depth - 1, enemy(to_move),
+                    -math.inf, math.inf)
+            probes.append(probe)
+            if maximizing:
+                lows[i] = probe
+            else:
+                highs[i] = probe
+
+        remaining_low = sum(p * k for (p, _), k in zip(outcomes, lows))
+        remaining_high = sum(p * k for (p, _), k in zip(outcomes, highs))
+
+        if remaining_low >= beta:
+            self._cutoff()
+            return remaining_low
+        if remaining_high <= alpha:
+            self._cutoff()
+            return remaining_high
+
+        # Star1: the outcomes searched so far together with the bounds of the
+        # remaining ones give a window for the value of the next outcome
+        value = 0
+        for i, (probability, children) in enumerate(outcomes):
+            remaining_low -= probability * lows[i]
+            remaining_high -= probability * highs[i]
+
+            outcome_alpha = (alpha - value - remaining_high) / probability
+            outcome_beta = (beta - value - remaining_low) / probability
 
-        result = 0
-        for dices in it.combinations_with_replacement(range(1, 7), 2):
-            multiplier = 1/36 if dices[0] == dices[1] else 1/18
-            max_value = modifier * -2**31
+            value += probability * self._choose(children, depth, to_move,
+                    outcome_alpha, outcome_beta, probes[i])
 
-            for _, possible_board in available_moves(board, dices,
-                    player_from_number(modifier)):
-                possible_board_value = self.maximize(possible_board, level+1,
-                        max_value)
-                if modifier * max_value < modifier * possible_board_value:
-                    max_value = possible_board_value
+            if value + remaining_low >= beta:
+                self._cutoff()
+                return value + remaining_low
+            if value + remaining_high <= alpha:
+                self._cutoff()
+                return value + remaining_high
+
+        return value
+
+    def _choose(self, children, depth, to_move, alpha, beta, first=None):
+        maximizing = to_move == self.player
+
+        if first is None:
+            best = None
+        else:
+            best = first
+            children = children[1:]
+            if maximizing and best >= beta or not maximizing and best <= alpha:
+                self._cutoff()
+                return best
+
+        for child in children:
+            if maximizing:
+                value = self._chance(child, depth - 1, enemy(to_move),
+                        alpha if best is None else max(alpha, best), beta)
+                if best is None or value > best:
+                    best = value
+                if best >= beta:
+                    self._cutoff()
+                    break
+            else:
+                value = self._chance(child, depth - 1, enemy(to_move), alpha,
+                        beta if best is None else min(beta, best))
+                if best is None or value < best:
+                    best = value
+                if best <= alpha:
+                    self._cutoff()
+                    break
+
+        return best
+
+    def _chance_leaves(self, board, to_move):
+        maximizing = to_move == self.player
+
+        # children of every dice outcome are evaluated in a single call
+        boards = []
+        offsets = [0]
+        for dices, _ in DICE_OUTCOMES:
+            boards.extend(self._children(board, dices, to_move))
+            offsets.append(len(boards))
+
+        values = self.evaluate_leaves(boards, enemy(to_move))
+
+        value = 0
+        for (_, probability), start, stop in zip(DICE_OUTCOMES, offsets,
+                offsets[1:]):
+            group = values[start:stop]
+            if self.race is None:
+                value += probability \
+                    * float(group.max() if maximizing else group.min())
+            else:
+                value += probability * (max(group) if maximizing
+                    else min(group))
+
+        return value
+
+    # values of boards with to_move to play, the same as searching them with
+    # no levels left, boards the race hook knows are valued by it and the rest
+    # in a single evaluate_batch call, the values are a list when race is set
+    def evaluate_leaves(self, boards, to_move):
+        if self.race is None:
+            return self._evaluate_batch(boards)
+
+        values = [self.race(board, to_move) for board in boards]
+        rest = [i for i, value in enumerate(values) if value is None]
+        if rest:
+            batch = self._evaluate_batch([boards[i] for i in rest])
+            for i, value in zip(rest, batch):
+                values[i] = float(value)
+
+        return values
+
+    def _evaluate_batch(self, boards):
+        stats = self.stats
+        if stats is None:
+            return self.evaluate_batch(boards)
+
+        started = stats.timer()
+        values = self.evaluate_batch(boards)
+        stats.evaluation_time += stats.timer() - started
+        stats.leaves += len(boards)
+
+        return values
+
+    def _children(self, board, dices, player):
+        stats = self.stats
+        expansions = self.expansions
+
+        if expansions is not None:
+            key = (board, dices, player)
+            children = expansions.get(key)
+            if children is not None:
+                if stats is not None:
+                    stats.expansion_hits += 1
+                return children
+
+        if stats is None:
+            children = tuple(b
+                for _, b in unique_available_moves(board, dices, player))
+        else:
+            started = stats.timer()
+            children = tuple(b
+                for _, b in unique_available_moves(board, dices, player))
+            stats.generation_time += stats.timer() - started
+            stats.moves += len(children)
+
+        if expansions is not None:
+            expansions.put(key, children)
+
+        return children
+
+    def _evaluate(self, board):
+        stats = self.stats
+        if stats is None:
+            return self.evaluate(board)
 
-                if previous_value is not None \
-                        and modifier * max_value <= modifier * previous_value:
-                    return max_value
+        started = stats.timer()
+        value = self.evaluate(board)
+        stats.evaluation_time += stats.timer() - started
+        stats.leaves += 1
 
-            result += modifier * multiplier * max_value
+        return value
 
-        return result
+    def _cutoff(self):
+        if self.stats is not None:
+            self.stats.cutoffs += 1
@@ -26,8 +26,10 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import math
 import random
 
+from backgammon.model.board import Board
 from backgammon.model.utils import player_modifier
 from backgammon.model.utils import jail_field
 from backgammon.model.utils import enemy
@@ -45,6 +47,10 @@ def tactic_killer(board, player):
 
 def tactic_push_forward(board, player):
     modifier = player_modifier(player)
+
+    if isinstance(board, Board):
+        return _push_forward_from_pips(board, modifier)
+
     result = 0
 
     player_checkers = 0
@@ -66,6 +72,29 @@ def tactic_push_forward(board, player):
     return result / 15
 
 
+# the same as above from the checker and pip counts kept by the board
+def _push_forward_from_pips(board, modifier):
+    white_checkers = board.checkers('w')
+    black_checkers = board.checkers('b')
+    white_pips = board.pips('w')
+    black_pips = board.pips('b')
+
+    if modifier == 1:
+        # checkers are weighted with their position
+        weighted = 25 * white_checkers - white_pips + black_pips
+    else:
+        # checkers are weighted with 26 less their position, white ones in
+        # the jail with 0
+        jail = board[0]
+        weighted = 26 * black_checkers - black_pips \
+            + white_checkers + white_pips - 26 * jail
+
+    push_forward = modifier * weighted / 28
+    push_forward -= white_checkers - black_checkers
+
+    return push_forward / 15
+
+
 def tactic_doors(board, player):
     modifier = player_modifier(player)
     result = 0
@@ -86,3 +115,36 @@ def tactic_doors(board, player):
 
 def tactic_random(board, player):
     return random.random() * 2 - 1
+
+
+# chance of player winning between -1 and 1 when no checker has to pass an
+# enemy one any more, estimated from the pip counts
+def race(board, player, to_move):
+    if not isinstance(board, Board):
+        board = Board(board)
+
+    pips = board.pips(player)
+    enemy_pips = board.pips(enemy(player))
+    if pips == 0:
+        return 1.0
+    if enemy_pips == 0:
+        return -1.0
+
+    # a turn moves a bit over 8 pips on average, so the player to move is
+    # about 4 pips ahead, and leads matter less in longer races
+    margin = enemy_pips - pips + (4 if to_move == player else -4)
+    return math.tanh(margin / (2 + 0.1 * (pips + enemy_pips)))
+
+
+# lowest and highest values of the tactics above
+BOUNDS = {
+    'tactic_killer': (-2, 2),
+    'tactic_push_forward': (-3, 3),
+    'tactic_doors': (-1, 1),
+    'tactic_random': (-1, 1),
+}
+
+
+def bounds(tactics):
+    lows, highs = zip(*(BOUNDS[tactic.__name__] for tactic in tactics))
+    return sum(lows), sum(highs)
@@ -0,0 +1,90 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import random
+import unittest
+
+import backgammon.bots.utils.batch_tactics as batch_tactics
+import backgammon.bots.utils.tactics as tactics
+import backgammon.model.config as config
+
+from backgammon.bots.utils.minmax import MinMax
+from backgammon.model.utils import unique_available_moves
+
+
+def random_boards(count, seed=0):
+    rng = random.Random(seed)
+    boards = []
+
+    for _ in range(count):
+        board = [0] * 26
+        for checker in (1, -1):
+            for _ in range(15):
+                board[rng.randint(0, 25)] += checker
+        boards.append(board)
+
+    return boards
+
+
+@unittest.skipUnless(batch_tactics.available(), 'numpy is not installed')
+class TestBatchTactics(unittest.TestCase):
+    def assert_same_scores(self, name):
+        boards = random_boards(50) + [config.INIT_BOARD]
+        array = batch_tactics.as_array(boards)
+
+        for player in ('w', 'b'):
+            scores = vars(batch_tactics)[name](array, player)
+            for board, score in zip(boards, scores):
+                self.assertAlmostEqual(vars(tactics)[name](board, player),
+                        score)
+
+    def test_tactic_killer(self):
+        self.assert_same_scores('tactic_killer')
+
+    def test_tactic_push_forward(self):
+        self.assert_same_scores('tactic_push_forward')
+
+    def test_tactic_doors(self):
+        self.assert_same_scores('tactic_doors')
+
+    def test_min_max_leaves(self):
+        def evaluate(board):
+            return tactics.tactic_push_forward(board, 'w')
+
+        def evaluate_batch(boards):
+            return batch_tactics.tactic_push_forward(
+                    batch_tactics.as_array(boards), 'w')
+
+        min_max = MinMax(evaluate, levels=1)
+        batch_min_max = MinMax(evaluate, levels=1,
+                evaluate_batch=evaluate_batch)
+
+        for _, board in unique_available_moves(config.INIT_BOARD, (6, 4),
+                'b'):
+            self.assertAlmostEqual(min_max.maximize(board),
+                    batch_min_max.maximize(board))
@@ -0,0 +1,96 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import tempfile
+import unittest
+
+import backgammon.bots.utils.bearoff as bearoff
+
+
+class TestBearOff(unittest.TestCase):
+    def test_index(self):
+        for checkers in range(5):
+            indices = sorted(bearoff.index(counts)
+                for counts in bearoff.positions(checkers))
+            self.assertEqual(indices, list(range(bearoff.size(checkers))))
+
+    def test_generate(self):
+        turns = bearoff.generate(3)
+
+        self.assertEqual(turns[bearoff.index((0, 0, 0, 0, 0, 0))], 0)
+        self.assertEqual(turns[bearoff.index((1, 0, 0, 0, 0, 0))], 1)
+        self.assertEqual(turns[bearoff.index((2, 0, 0, 0, 0, 0))], 1)
+        # only 1-2, 1-3, 1-4, 2-3 and 1-1 leave the checker on the board
+        self.assertAlmostEqual(turns[bearoff.index((0, 0, 0, 0, 0, 1))],
+                1.25)
+
+        smaller = bearoff.generate(2)
+        self.assertEqual(turns[:len(smaller)], smaller)
+
+    def test_database(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'bearoff.db')
+
+        turns = bearoff.generate(3)
+        bearoff.save(turns, path, checkers=3)
+        database = bearoff.Database(path)
+        self.addCleanup(database.close)
+
+        self.assertAlmostEqual(database.expected_turns((0, 1, 0, 0, 2, 0)),
+                turns[bearoff.index((0, 1, 0, 0, 2, 0))], places=5)
+        self.assertIsNone(database.expected_turns((0, 0, 0, 0, 0, 4)))
+
+        board = [0] * 26
+        board[24] = 1
+        board[20] = 1
+        board[6] = -2
+
+        self.assertGreater(database.winning_chance(board, 'w', 'w'), 0)
+        self.assertLess(database.winning_chance(board, 'b', 'w'), 0)
+
+        board[3] = 1
+        self.assertIsNone(database.winning_chance(board, 'w', 'w'))
+
+    def test_load_truncated_database(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'bearoff.db')
+
+        bearoff.save(bearoff.generate(2), path, checkers=2)
+        with open(path, 'rb') as database:
+            data = database.read()
+
+        for length in (len(data) - 1, 5, 0):
+            truncated = '{}.{}'.format(path, length)
+            with open(truncated, 'wb') as database:
+                database.write(data[:length])
+
+            with self.assertLogs('BearOff', 'WARNING'):
+                self.assertIsNone(bearoff.load(truncated))
@@ -0,0 +1,165 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+import backgammon.bots.utils.batch_tactics as batch_tactics
+import backgammon.bots.utils.tactics as tactics
+
+from backgammon.bots.utils.minmax import MinMax
+from backgammon.bots.utils.stats import SearchStats
+from backgammon.bots.utils.transposition import TranspositionTable
+from backgammon.model.board import Board
+
+
+def evaluate(board):
+    return tactics.tactic_push_forward(board, 'w') \
+        + tactics.tactic_doors(board, 'w')
+
+
+BOUNDS = tactics.bounds([tactics.tactic_push_forward, tactics.tactic_doors])
+
+
+def boards():
+    board = [0] * 26
+    board[14] = 2
+    board[20] = 1
+    board[22] = 2
+    board[9] = -2
+    board[5] = -1
+    board[3] = -2
+    yield board
+
+    board = [0] * 26
+    board[0] = 1
+    board[18] = 2
+    board[23] = 1
+    board[4] = -1
+    board[2] = -3
+    board[21] = -1
+    yield board
+
+
+class TestMinMax(unittest.TestCase):
+    def search(self, board, levels, **kwargs):
+        stats = SearchStats()
+        min_max = MinMax(evaluate, levels, player='w', stats=stats, **kwargs)
+        return min_max.maximize(board), stats.nodes + stats.leaves
+
+    def test_level_zero_evaluates(self):
+        for board in boards():
+            self.assertEqual(MinMax(evaluate, 0).maximize(board),
+                    evaluate(board))
+
+    def test_pruning_keeps_value(self):
+        for board in boards():
+            for levels in (1, 2):
+                value, visited = self.search(board, levels, bounds=BOUNDS)
+                expected, expected_visited = self.search(board, levels)
+
+                self.assertAlmostEqual(value, expected)
+                self.assertLessEqual(visited, expected_visited)
+
+    def test_pruning_visits_fewer_nodes(self):
+        board = next(boards())
+
+        _, visited = self.search(board, 2, bounds=BOUNDS)
+        _, expected_visited = self.search(board, 2)
+
+        self.assertLess(visited, expected_visited)
+
+    def test_table_keeps_value(self):
+        for board in boards():
+            expected, _ = self.search(board, 2, bounds=BOUNDS)
+            table = TranspositionTable()
+
+            for _ in range(2):
+                value, _ = self.search(board, 2, bounds=BOUNDS, table=table)
+                self.assertAlmostEqual(value, expected)
+
+    def test_expansions_keep_value(self):
+        for board in boards():
+            expected, _ = self.search(board, 2, bounds=BOUNDS)
+            expansions = TranspositionTable()
+
+            for _ in range(2):
+                value, _ = self.search(board, 2, bounds=BOUNDS,
+                        expansions=expansions)
+                self.assertAlmostEqual(value, expected)
+
+            self.assertGreater(expansions.hits, 0)
+
+    def test_tables_hit_two_levels_deep(self):
+        # the same positions are reached through different rolls
+        for board in boards():
+            table = TranspositionTable()
+            expansions = TranspositionTable(weigh=len)
+            self.search(board, 2, bounds=BOUNDS, table=table,
+                    expansions=expansions)
+
+            self.assertGreater(table.hits, 0)
+            self.assertGreater(expansions.hits, 0)
+
+    def test_window_bounds(self):
+        board = next(boards())
+        expected, _ = self.search(board, 2)
+
+        min_max = MinMax(evaluate, 2, player='w', bounds=BOUNDS)
+        self.assertGreaterEqual(min_max.maximize(board, beta=expected - 0.1),
+                expected - 0.1)
+        self.assertLessEqual(min_max.maximize(board, alpha=expected + 0.1),
+                expected + 0.1)
+
+    @unittest.skipUnless(batch_tactics.available(), 'numpy is not installed')
+    def test_batch_values_races(self):
+        # some of black's replies pass the last white checkers
+        board = [0] * 26
+        board[19] = 2
+        board[20] = 2
+        board[24] = 11
+        board[22] = -1
+        board[5] = -7
+        board[3] = -7
+
+        def race(board, to_move):
+            if board.has_contact():
+                return None
+            return tactics.race(board, 'w', to_move)
+
+        def evaluate_batch(boards):
+            return batch_tactics.tactic_push_forward(
+                    batch_tactics.as_array(boards), 'w')
+
+        expected = MinMax(lambda b: tactics.tactic_push_forward(b, 'w'), 1,
+                player='w', race=race).maximize(board)
+        value = MinMax(lambda b: tactics.tactic_push_forward(b, 'w'), 1,
+                player='w', race=race,
+                evaluate_batch=evaluate_batch).maximize(board)
+
+        self.assertTrue(Board(board).has_contact())
+        self.assertAlmostEqual(value, expected)
@@ -0,0 +1,67 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+import backgammon.bots.utils.tactics as tactics
+import backgammon.model.config as config
+
+from backgammon.model.board import Board
+from backgammon.model.utils import unique_available_moves
+
+
+class TestTactics(unittest.TestCase):
+    def test_push_forward_from_pips(self):
+        board = list(config.INIT_BOARD)
+        board[0] = 2
+        board[1] = 0
+        board[25] = -1
+        board[24] = -1
+
+        for start in (config.INIT_BOARD, board):
+            for player in ('w', 'b'):
+                for _, new_board in unique_available_moves(start, (6, 1),
+                        player):
+                    for color in ('w', 'b'):
+                        self.assertAlmostEqual(
+                                tactics.tactic_push_forward(new_board, color),
+                                tactics.tactic_push_forward(list(new_board),
+                                    color))
+
+    def test_race(self):
+        board = [0] * 26
+        board[20] = 3
+        board[10] = -3
+
+        self.assertGreater(tactics.race(board, 'w', 'w'), 0)
+        self.assertLess(tactics.race(board, 'b', 'w'), 0)
+        self.assertAlmostEqual(tactics.race(board, 'w', 'b'),
+                -tactics.race(Board(board), 'b', 'b'))
+
+        board[20] = 0
+        self.assertEqual(tactics.race(board, 'w', 'b'), 1)
@@ -0,0 +1,87 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from backgammon.bots.utils.transposition import TranspositionTable
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def test_get_and_put(self):
+        table = TranspositionTable(max_entries=4)
+
+        self.assertIsNone(table.get('a'))
+        table.put('a', 1)
+        self.assertEqual(table.get('a'), 1)
+
+        self.assertEqual(table.hits, 1)
+        self.assertEqual(table.misses, 1)
+        self.assertEqual(table.hit_rate, 0.5)
+
+    def test_lru_eviction(self):
+        table = TranspositionTable(max_entries=2)
+
+        table.put('a', 1)
+        table.put('b', 2)
+        table.get('a')
+        table.put('c', 3)
+
+        self.assertEqual(len(table), 2)
+        self.assertIn('a', table)
+        self.assertNotIn('b', table)
+        self.assertIn('c', table)
+
+    def test_weighed_eviction(self):
+        table = TranspositionTable(max_entries=5, weigh=len)
+
+        table.put('a', (1, 2))
+        table.put('b', (3, 4))
+        table.put('a', (5,))
+        self.assertEqual(table.weight, 3)
+
+        table.put('c', (6, 7, 8))
+
+        self.assertEqual(table.weight, 4)
+        self.assertNotIn('b', table)
+        self.assertIn('a', table)
+        self.assertIn('c', table)
+
+        table.put('d', tuple(range(9)))
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table.weight, 9)
+
+    def test_clear(self):
+        table = TranspositionTable()
+
+        table.put('a', 1)
+        table.get('a')
+        table.clear()
+
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.hits, 0)
+        self.assertEqual(table.misses, 0)
@@ -80,8 +80,7 @@ def main(white=None, black=None, *args, **kwargs):
     active_dice = 0
     active_dice_text_pos = None
 
-    game.set_changed()
-    game.notify_observers()
+    game.start()
 
     while is_running:
         for event in pygame.event.get():
@@ -0,0 +1,150 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import collections
+import csv
+import json
+import math
+import mmap
+import os
+
+import backgammon.judge.records as records
+
+COLUMNS = ('bot', 'opponent', 'wins', 'losses', 'games', 'win_rate',
+        'low', 'high')
+
+
+# Wilson score interval of the win rate, z = 1.96 gives 95% confidence
+def confidence_interval(wins, games, z=1.96):
+    if games == 0:
+        return 0.0, 1.0
+
+    rate = wins / games
+    denominator = 1 + z * z / games
+    center = (rate + z * z / (2 * games)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / games
+            + z * z / (4 * games * games)) / denominator
+
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+# Wins of every bot against every opponent in a log of game records. The
+# offset of the first record not folded in yet is kept together with the
+# counts, so a saved aggregate only reads records appended since.
+class Aggregate:
+    def __init__(self, offset=0, wins=()):
+        self.offset = offset
+        self.wins = collections.Counter(dict(wins))
+
+    def update(self, path):
+        with open(path, 'rb') as log:
+            size = os.fstat(log.fileno()).st_size
+            if size < self.offset:
+                # the log was replaced, start over
+                self.offset = 0
+                self.wins.clear()
+
+            if size == self.offset:
+                return 0
+
+            with mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return self._fold(buffer)
+
+    def _fold(self, buffer):
+        folded = 0
+
+        while True:
+            found = records.payload_at(buffer, self.offset)
+            if found is None:
+                return folded
+
+            payload, self.offset = found
+            white, black, winner = records.decode_result(payload)
+            folded += 1
+
+            if winner == 'w':
+                self.wins[white, black] += 1
+            elif winner == 'b':
+                self.wins[black, white] += 1
+
+    def rows(self):
+        bots = sorted({bot for pair in self.wins for bot in pair})
+
+        # games of a bot against itself tell nothing about its strength
+        for bot in bots:
+            for opponent in bots:
+                if bot == opponent:
+                    continue
+
+                wins = self.wins[bot, opponent]
+                losses = self.wins[opponent, bot]
+                games = wins + losses
+                if games == 0:
+                    continue
+
+                low, high = confidence_interval(wins, games)
+                yield dict(zip(COLUMNS, (bot, opponent, wins, losses, games,
+                        wins / games, low, high)))
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as index:
+            state = json.load(index)
+
+        return cls(state['offset'],
+                {(winner, loser): count
+                    for winner, loser, count in state['wins']})
+
+    def save(self, path):
+        state = {
+            'offset': self.offset,
+            'wins': [[winner, loser, count]
+                for (winner, loser), count in sorted(self.wins.items())],
+        }
+
+        # the index is replaced at once, so an interrupted save keeps the old
+        temporary = path + '.tmp'
+        with open(temporary, 'w') as index:
+            json.dump(state, index)
+        os.replace(temporary, path)
+
+
+def write_csv(rows, output):
+    writer = csv.DictWriter(output, COLUMNS)
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def write_json(rows, output):
+    matrix = {}
+    for row in rows:
+        matrix.setdefault(row['bot'], {})[row['opponent']] = \
+            {k: row[k] for k in COLUMNS[2:]}
+
+    json.dump(matrix, output, indent=2, sort_keys=True)
+    output.write('\n')
@@ -29,6 +29,7 @@
 import logging
 import threading
 
+from backgammon.model.game import GAME_OVER
 from backgammon.model.game import Game
 
 log = logging.getLogger('Judge')
@@ -40,27 +41,48 @@ class Judge:
 
         self._game_is_running_cv = game_is_running_cv
 
-    def update(self, observable):
-        if observable.winner is not None:
-            with self._game_is_running_cv:
-                self._game_is_running_cv.notify_all()
+    def game_over(self, event):
+        with self._game_is_running_cv:
+            self._game_is_running_cv.notify_all()
 
 
-def main(white, black, *args, **kwargs):
+def play(white, black, game=None):
     game_is_running_cv = threading.Condition()
 
     with game_is_running_cv:
-        game = Game()
+        if game is None:
+            game = Game()
         judge = Judge(game_is_running_cv)
-        game.add_observer(judge)
+        game.subscribe(judge.game_over, (GAME_OVER,))
 
         bots = []
         bots.append(white(game.get_player('w')))
         bots.append(black(game.get_player('b')))
 
-        game.set_changed()
-        game.notify_observers()
+        game.start()
 
         game_is_running_cv.wait_for(lambda: game.winner is not None)
 
-        print(game.winner)
+        return game.winner
+
+
+def play_synchronous(white, black, game=None):
+    if game is None:
+        game = Game(_synchronous=True)
+
+    bots = {
+        'w': white(game.get_player('w')),
+        'b': black(game.get_player('b')),
+    }
+
+    while game.winner is None:
+        bots[game.active_player].move()
+
+    return game.winner
+
+
+def main(white, black, synchronous=False, *args, **kwargs):
+    if synchronous:
+        print(play_synchronous(white, black))
+    else:
+        print(play(white, black))
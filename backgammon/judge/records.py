@@ -0,0 +1,194 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import collections
+import struct
+
+from backgammon.model.game import Turn
+
+# A log is a sequence of records, each one a little endian 32-bit payload
+# length followed by the payload:
+#
+#   version, start time, duration, winner, name lengths  _HEADER
+#   white bot name, black bot name, seed                 utf-8
+#   number of turns                                      _COUNT
+#   for every turn: color, dice, number of moves         _TURN
+#       for every move: position, distance               _MOVE
+#
+# Colors are b'w' and b'b', b'-' when there is none, and a missing seed is
+# stored with the length _NO_SEED.
+
+Record = collections.namedtuple('Record', ['white', 'black', 'seed', 'turns',
+    'winner', 'started', 'duration'])
+
+VERSION = 1
+
+_LENGTH = struct.Struct('<I')
+_HEADER = struct.Struct('<BddcHHH')
+_COUNT = struct.Struct('<I')
+_TURN = struct.Struct('<cBBB')
+_MOVE = struct.Struct('<BB')
+
+_NO_SEED = 0xffff
+
+
+class FormatError(Exception):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+
+def _color(color):
+    return b'-' if color is None else color.encode()
+
+
+def _from_color(color):
+    return None if color == b'-' else color.decode()
+
+
+def encode(record):
+    white = record.white.encode()
+    black = record.black.encode()
+    seed = b'' if record.seed is None else str(record.seed).encode()
+
+    parts = [
+        _HEADER.pack(VERSION, record.started, record.duration,
+                _color(record.winner), len(white), len(black),
+                _NO_SEED if record.seed is None else len(seed)),
+        white,
+        black,
+        seed,
+        _COUNT.pack(len(record.turns)),
+    ]
+
+    for color, dice, moves in record.turns:
+        parts.append(_TURN.pack(_color(color), dice[0], dice[1], len(moves)))
+        for position, distance in moves:
+            parts.append(_MOVE.pack(position, distance))
+
+    payload = b''.join(parts)
+    return _LENGTH.pack(len(payload)) + payload
+
+
+def decode(payload):
+    try:
+        version, started, duration, winner, white_length, black_length, \
+                seed_length = _HEADER.unpack_from(payload)
+        if version != VERSION:
+            raise FormatError('unknown version {}'.format(version))
+        offset = _HEADER.size
+
+        white = payload[offset:offset + white_length].decode()
+        offset += white_length
+        black = payload[offset:offset + black_length].decode()
+        offset += black_length
+        if seed_length == _NO_SEED:
+            seed = None
+        else:
+            seed = payload[offset:offset + seed_length].decode()
+            offset += seed_length
+
+        count, = _COUNT.unpack_from(payload, offset)
+        offset += _COUNT.size
+
+        turns = []
+        for _ in range(count):
+            color, first, second, moves_count = _TURN.unpack_from(payload,
+                    offset)
+            offset += _TURN.size
+
+            moves = tuple(_MOVE.unpack_from(payload, offset + i * _MOVE.size)
+                for i in range(moves_count))
+            offset += moves_count * _MOVE.size
+
+            turns.append(Turn(_from_color(color), (first, second), moves))
+    except (struct.error, UnicodeDecodeError) as e:
+        raise FormatError(e)
+
+    return Record(white, black, seed, tuple(turns), _from_color(winner),
+            started, duration)
+
+
+# bot names and the winner of a record without decoding its turns
+def decode_result(payload):
+    try:
+        version, _, _, winner, white_length, black_length, _ = \
+                _HEADER.unpack_from(payload)
+        if version != VERSION:
+            raise FormatError('unknown version {}'.format(version))
+        offset = _HEADER.size
+
+        white = bytes(payload[offset:offset + white_length]).decode()
+        offset += white_length
+        black = bytes(payload[offset:offset + black_length]).decode()
+    except (struct.error, UnicodeDecodeError) as e:
+        raise FormatError(e)
+
+    return white, black, _from_color(winner)
+
+
+# payload of the record at offset of a buffer and the offset of the next one,
+# None when the record is cut short
+def payload_at(buffer, offset):
+    start = offset + _LENGTH.size
+    if start > len(buffer):
+        return None
+
+    size, = _LENGTH.unpack_from(buffer, offset)
+    if start + size > len(buffer):
+        return None
+
+    return buffer[start:start + size], start + size
+
+
+def write(output, record):
+    output.write(encode(record))
+
+
+# yields (offset, record) pairs of the records of a binary file, a record cut
+# short by an interrupted writer ends the log
+def read(records_file):
+    offset = records_file.tell()
+
+    while True:
+        length = records_file.read(_LENGTH.size)
+        if len(length) < _LENGTH.size:
+            return
+
+        size, = _LENGTH.unpack(length)
+        payload = records_file.read(size)
+        if len(payload) < size:
+            return
+
+        yield offset, decode(payload)
+        offset += _LENGTH.size + size
+
+
+def load(path):
+    with open(path, 'rb') as records_file:
+        for _, record in read(records_file):
+            yield record
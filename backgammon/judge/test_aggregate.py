@@ -0,0 +1,108 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import tempfile
+import unittest
+
+import backgammon.judge.records as records
+
+from backgammon.judge.aggregate import Aggregate
+from backgammon.judge.aggregate import confidence_interval
+
+
+def record(white, black, winner):
+    return records.Record(white, black, None, (), winner, 0.0, 0.0)
+
+
+class TestAggregate(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.log = os.path.join(directory.name, 'matches.rec')
+        self.index = os.path.join(directory.name, 'matches.rec.index')
+
+    def append(self, *games):
+        with open(self.log, 'ab') as log:
+            for game in games:
+                records.write(log, record(*game))
+
+    def test_incremental_update(self):
+        self.append(('a', 'b', 'w'), ('a', 'b', 'b'), ('b', 'a', 'w'))
+
+        aggregate = Aggregate()
+        self.assertEqual(aggregate.update(self.log), 3)
+        aggregate.save(self.index)
+
+        self.append(('a', 'b', 'w'))
+
+        aggregate = Aggregate.load(self.index)
+        self.assertEqual(aggregate.update(self.log), 1)
+        self.assertEqual(aggregate.update(self.log), 0)
+
+        rows = {(row['bot'], row['opponent']): row
+            for row in aggregate.rows()}
+        self.assertEqual(rows['a', 'b']['wins'], 2)
+        self.assertEqual(rows['a', 'b']['losses'], 2)
+        self.assertEqual(rows['b', 'a']['win_rate'], 0.5)
+
+    def test_truncated_record_is_read_later(self):
+        self.append(('a', 'b', 'w'), ('a', 'b', 'w'))
+        with open(self.log, 'rb') as log:
+            content = log.read()
+
+        with open(self.log, 'wb') as log:
+            log.write(content[:-1])
+
+        aggregate = Aggregate()
+        self.assertEqual(aggregate.update(self.log), 1)
+
+        with open(self.log, 'wb') as log:
+            log.write(content)
+        self.assertEqual(aggregate.update(self.log), 1)
+
+    def test_replaced_log(self):
+        self.append(('a', 'b', 'w'), ('a', 'b', 'w'))
+        aggregate = Aggregate()
+        aggregate.update(self.log)
+
+        os.remove(self.log)
+        self.append(('a', 'b', 'b'))
+        aggregate.update(self.log)
+
+        self.assertEqual(dict(aggregate.wins), {('b', 'a'): 1})
+
+    def test_confidence_interval(self):
+        low, high = confidence_interval(50, 100)
+        self.assertAlmostEqual(low + high, 1)
+        self.assertLess(low, 0.5)
+        self.assertGreater(high, 0.5)
+
+        self.assertEqual(confidence_interval(0, 0), (0.0, 1.0))
+        self.assertEqual(confidence_interval(10, 10)[1], 1.0)
@@ -0,0 +1,89 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import random
+import threading
+import unittest
+
+from backgammon.judge.main import play
+from backgammon.judge.main import play_synchronous
+from backgammon.model.game import Game
+from backgammon.model.utils import unique_available_moves
+
+
+class FirstMoveBot:
+    def __init__(self, player):
+        self._player = player
+        self._moving = threading.Lock()
+
+        self._player.add_observer(self)
+
+    def update(self, player):
+        if self._player.is_active():
+            threading.Thread(target=self._move_exclusively).start()
+
+    def _move_exclusively(self):
+        # whole turns are played under the lock, extra threads find that the
+        # turn has already been played
+        with self._moving:
+            self.move()
+
+    def move(self):
+        if not self._player.is_active():
+            return
+
+        board = self._player.board
+        dice = self._player.dice
+        history, _ = next(unique_available_moves(board, dice,
+                self._player.color))
+
+        for position, distance in history:
+            self._player.move(position, distance)
+
+
+def dice_roller(seed):
+    rng = random.Random(seed)
+    return lambda: (rng.randint(1, 6), rng.randint(1, 6))
+
+
+class TestMain(unittest.TestCase):
+    def test_synchronous_game_matches_threaded_game(self):
+        for seed in range(5):
+            threaded_game = Game(_dice_roller=dice_roller(seed),
+                    _starting_player='w')
+            synchronous_game = Game(_dice_roller=dice_roller(seed),
+                    _starting_player='w', _synchronous=True)
+
+            threaded_winner = play(FirstMoveBot, FirstMoveBot, threaded_game)
+            synchronous_winner = play_synchronous(FirstMoveBot, FirstMoveBot,
+                    synchronous_game)
+
+            self.assertEqual(threaded_winner, synchronous_winner)
+            self.assertEqual(threaded_game.board, synchronous_game.board)
+            self.assertEqual(threaded_game.history,
+                    synchronous_game.history)
@@ -0,0 +1,93 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import io
+import unittest
+
+import backgammon.judge.records as records
+import backgammon.model.config as config
+
+from backgammon.judge.main import play_synchronous
+from backgammon.judge.test_main import FirstMoveBot
+from backgammon.judge.test_main import dice_roller
+from backgammon.model.game import Game
+from backgammon.model.utils import get_winner
+from backgammon.model.utils import make_move
+
+
+def game_record(seed):
+    game = Game(_dice_roller=dice_roller(seed), _starting_player='w',
+            _synchronous=True)
+    winner = play_synchronous(FirstMoveBot, FirstMoveBot, game)
+
+    return records.Record('first', 'first', str(seed), tuple(game.history),
+            winner, 1234.5, 0.25)
+
+
+class TestRecords(unittest.TestCase):
+    def test_encode_decode(self):
+        record = game_record(0)
+        encoded = records.encode(record)
+
+        self.assertEqual(records.decode(encoded[4:]), record)
+        self.assertEqual(records.decode(records.encode(
+                record._replace(seed=None, winner=None))[4:]).seed, None)
+
+    def test_replay(self):
+        record = game_record(1)
+        board = config.INIT_BOARD
+
+        for color, _, moves in record.turns:
+            for position, distance in moves:
+                board = make_move(board, position, distance, color)
+
+        self.assertEqual(get_winner(board), record.winner)
+
+    def test_read(self):
+        output = io.BytesIO()
+        expected = [game_record(seed) for seed in range(3)]
+        for record in expected:
+            records.write(output, record)
+
+        # the last record was cut short by an interrupted writer
+        log = output.getvalue()
+        output = io.BytesIO(log[:-1])
+
+        result = list(records.read(output))
+        self.assertEqual([record for _, record in result], expected[:2])
+        self.assertEqual(result[0][0], 0)
+
+        output.seek(result[1][0])
+        self.assertEqual(next(records.read(output)), result[1])
+
+    def test_unknown_version(self):
+        encoded = bytearray(records.encode(game_record(0)))
+        encoded[4] = records.VERSION + 1
+
+        with self.assertRaises(records.FormatError):
+            records.decode(bytes(encoded[4:]))
@@ -0,0 +1,137 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import concurrent.futures
+import contextlib
+import importlib
+import io
+import itertools as it
+import logging
+import random
+import time
+
+import backgammon.judge.records as records
+
+from backgammon.judge.main import play
+from backgammon.judge.main import play_synchronous
+from backgammon.model.game import Game
+
+log = logging.getLogger('Tournament')
+
+
+def bot_name(bot):
+    return getattr(bot, 'name', type(bot).__module__)
+
+
+def play_game(white, black, seed=None, synchronous=False):
+    if seed is not None:
+        random.seed(seed)
+
+    names = {}
+
+    def load_bot(module):
+        bot_class = importlib.import_module(module).Bot
+
+        def create(player):
+            bot = bot_class(player)
+            names[player.color] = bot_name(bot)
+            return bot
+
+        return create
+
+    started = time.time()
+    timer = time.perf_counter()
+
+    game = Game(_synchronous=synchronous)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if synchronous:
+            winner = play_synchronous(load_bot(white), load_bot(black), game)
+        else:
+            winner = play(load_bot(white), load_bot(black), game)
+
+    return records.Record(names['w'], names['b'], seed, tuple(game.history),
+            winner, started, time.perf_counter() - timer)
+
+
+def schedule(pairs, games, seed=None, synchronous=False):
+    rounds = it.count() if games == 0 else range(games)
+
+    for i in rounds:
+        for j, (white, black) in enumerate(pairs):
+            game_seed = None if seed is None \
+                else '{}:{}:{}'.format(seed, i, j)
+            yield white, black, game_seed, synchronous
+
+
+def run(pairs, games, output, workers=None, seed=None, synchronous=False,
+        report_every=100):
+    tasks = schedule(pairs, games, seed, synchronous)
+    started = time.perf_counter()
+    played = 0
+
+    def record(result):
+        nonlocal played
+        records.write(output, result)
+        output.flush()
+        played += 1
+
+        if played % report_every == 0:
+            log.info('{} games, {:.2f} games/s'.format(played,
+                    played / (time.perf_counter() - started)))
+
+    try:
+        if not workers:
+            for task in tasks:
+                record(play_game(*task))
+        else:
+            _run_pool(tasks, workers, record)
+    except KeyboardInterrupt:
+        log.info('interrupted')
+
+    elapsed = time.perf_counter() - started
+    return played, elapsed
+
+
+def _run_pool(tasks, workers, record):
+    executor = concurrent.futures.ProcessPoolExecutor(workers)
+    pending = set()
+
+    try:
+        for task in tasks:
+            pending.add(executor.submit(play_game, *task))
+
+            if len(pending) >= 2 * workers:
+                done, pending = concurrent.futures.wait(pending,
+                        return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    record(future.result())
+
+        for future in concurrent.futures.as_completed(pending):
+            record(future.result())
+    finally:
+        executor.shutdown(cancel_futures=True)
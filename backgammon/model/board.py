@@ -0,0 +1,298 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import random
+
+# fields where checkers keep their player from bearing off, the same as
+# backgammon.model.utils.non_home_fields
+_WHITE_NON_HOME = range(1, 19)
+_BLACK_NON_HOME = range(7, 25)
+
+_BOARD_MASK = sum(1 << k for k in range(1, 25))
+
+# Zobrist keys: a position's key is the xor of _ZOBRIST[field][value + 15]
+# over all fields, the key of an empty field being 0, so changing a field
+# updates it in O(1). The keys are seeded to be the same in every process.
+_zobrist_random = random.Random(0x5eed)
+_ZOBRIST = tuple(
+    tuple(0 if value == 0 else _zobrist_random.getrandbits(64)
+        for value in range(-15, 16))
+    for _ in range(26))
+
+# xored into the key of a position with black to move
+BLACK_TO_MOVE = _zobrist_random.getrandbits(64)
+
+
+def _positions(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+# counters of the checkers of both players kept along with the fields
+class _Counted:
+    __slots__ = ('_key', '_white_outside', '_black_outside',
+            '_white_occupied', '_black_occupied', '_white_checkers',
+            '_black_checkers', '_white_pips', '_black_pips')
+
+    def _count(self, fields):
+        self._key = 0
+        for i, k in enumerate(fields):
+            self._key ^= _ZOBRIST[i][k + 15]
+
+        self._white_outside = sum(fields[k] for k in _WHITE_NON_HOME
+                if fields[k] > 0)
+        self._black_outside = sum(-fields[k] for k in _BLACK_NON_HOME
+                if fields[k] < 0)
+
+        self._white_occupied = 0
+        self._black_occupied = 0
+        self._white_checkers = 0
+        self._black_checkers = 0
+        self._white_pips = 0
+        self._black_pips = 0
+        for i, k in enumerate(fields):
+            if k > 0:
+                self._white_occupied |= 1 << i
+                self._white_checkers += k
+                self._white_pips += k * (25 - i)
+            elif k < 0:
+                self._black_occupied |= 1 << i
+                self._black_checkers -= k
+                self._black_pips -= k * i
+
+    def _copy_counters(self, other):
+        self._key = other._key
+        self._white_outside = other._white_outside
+        self._black_outside = other._black_outside
+        self._white_occupied = other._white_occupied
+        self._black_occupied = other._black_occupied
+        self._white_checkers = other._white_checkers
+        self._black_checkers = other._black_checkers
+        self._white_pips = other._white_pips
+        self._black_pips = other._black_pips
+
+    # 64-bit Zobrist key of the fields
+    @property
+    def key(self):
+        return self._key
+
+    def is_home(self, player):
+        outside = self._white_outside if player == 'w' else self._black_outside
+        return outside == 0
+
+    # checkers of player on the board and in the jail
+    def checkers(self, player):
+        return self._white_checkers if player == 'w' else self._black_checkers
+
+    # pips player has to move to bear off all of their checkers
+    def pips(self, player):
+        return self._white_pips if player == 'w' else self._black_pips
+
+    # whether a checker still has to pass one of the enemy, white moving up
+    # from its jail at 0 and black down from its jail at 25
+    def has_contact(self):
+        white = self._white_occupied
+        black = self._black_occupied
+        if not white or not black:
+            return False
+        return (white & -white).bit_length() < black.bit_length()
+
+    def occupied(self, player):
+        mask = self._white_occupied if player == 'w' else self._black_occupied
+        return _positions(mask & _BOARD_MASK)
+
+
+class Board(_Counted):
+    __slots__ = ('fields', '_mirror_key')
+
+    def __init__(self, fields):
+        self.fields = tuple(fields)
+        self._mirror_key = None
+        self._count(self.fields)
+
+    @classmethod
+    def from_list(cls, fields):
+        return cls(fields)
+
+    def to_list(self):
+        return list(self.fields)
+
+    # key of the fields with the colors swapped, backgammon.model.utils.mirror,
+    # computed when first needed
+    @property
+    def mirror_key(self):
+        if self._mirror_key is None:
+            key = 0
+            for i, k in enumerate(self.fields):
+                key ^= _ZOBRIST[25 - i][15 - k]
+            self._mirror_key = key
+        return self._mirror_key
+
+    def replace(self, changes):
+        board = SearchBoard(self)
+        board._set(changes)
+        return board.snapshot()
+
+    def copy(self):
+        return self
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getitem__(self, key):
+        return self.fields[key]
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __hash__(self):
+        return self._key
+
+    def __eq__(self, other):
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self._key == other._key and self.fields == other.fields
+
+    def __repr__(self):
+        return 'Board({})'.format(list(self.fields))
+
+
+# Mutable board for trying moves in place during searches. apply returns what
+# undo needs to take the changes back, and a Board is only built by snapshot
+# for positions that are kept.
+class SearchBoard(_Counted):
+    __slots__ = ('fields', )
+
+    def __init__(self, board):
+        if not isinstance(board, Board):
+            board = Board(board)
+
+        self.fields = list(board.fields)
+        self._copy_counters(board)
+
+    def apply(self, changes):
+        fields = self.fields
+        undo = ([(position, fields[position]) for position, _ in changes],
+                self._counters())
+        self._set(changes)
+        return undo
+
+    def undo(self, undo):
+        fields = self.fields
+        changes, counters = undo
+        for position, value in changes:
+            fields[position] = value
+
+        self._key, self._white_outside, self._black_outside, \
+            self._white_occupied, self._black_occupied, \
+            self._white_checkers, self._black_checkers, self._white_pips, \
+            self._black_pips = counters
+
+    def _counters(self):
+        return (self._key, self._white_outside, self._black_outside,
+                self._white_occupied, self._black_occupied,
+                self._white_checkers, self._black_checkers,
+                self._white_pips, self._black_pips)
+
+    def _set(self, changes):
+        fields = self.fields
+        key = self._key
+        white_outside = self._white_outside
+        black_outside = self._black_outside
+        white_occupied = self._white_occupied
+        black_occupied = self._black_occupied
+        white_checkers = self._white_checkers
+        black_checkers = self._black_checkers
+        white_pips = self._white_pips
+        black_pips = self._black_pips
+
+        for position, value in changes:
+            old_value = fields[position]
+            fields[position] = value
+            bit = 1 << position
+
+            zobrist = _ZOBRIST[position]
+            key ^= zobrist[old_value + 15] ^ zobrist[value + 15]
+
+            white = (value if value > 0 else 0) \
+                - (old_value if old_value > 0 else 0)
+            black = (old_value if old_value < 0 else 0) \
+                - (value if value < 0 else 0)
+            white_checkers += white
+            black_checkers += black
+            white_pips += white * (25 - position)
+            black_pips += black * position
+
+            if value > 0:
+                white_occupied |= bit
+                black_occupied &= ~bit
+            elif value < 0:
+                white_occupied &= ~bit
+                black_occupied |= bit
+            else:
+                white_occupied &= ~bit
+                black_occupied &= ~bit
+
+            if 1 <= position <= 18:
+                white_outside += white
+            if 7 <= position <= 24:
+                black_outside += black
+
+        self._key = key
+        self._white_outside = white_outside
+        self._black_outside = black_outside
+        self._white_occupied = white_occupied
+        self._black_occupied = black_occupied
+        self._white_checkers = white_checkers
+        self._black_checkers = black_checkers
+        self._white_pips = white_pips
+        self._black_pips = black_pips
+
+    def snapshot(self):
+        board = Board.__new__(Board)
+        board.fields = tuple(self.fields)
+        board._mirror_key = None
+        board._copy_counters(self)
+        return board
+
+    def __getitem__(self, key):
+        return self.fields[key]
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __repr__(self):
+        return 'SearchBoard({})'.format(self.fields)
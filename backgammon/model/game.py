@@ -26,22 +26,38 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import collections
+import contextlib
 import logging
 import random
 import threading
 
+from backgammon.model.board import Board
 from backgammon.model.config import INIT_BOARD
 
+from backgammon.model.utils import dice_moves
 from backgammon.model.utils import make_move
+from backgammon.model.utils import position_key
 from backgammon.model.utils import get_winner
 from backgammon.model.utils import is_any_legal_move
+from backgammon.model.utils import legal_moves
 from backgammon.model.utils import roll_dice
 from backgammon.model.utils import enemy
+from backgammon.model.utils import unique_available_moves
 
 from utils.observable import Observable
 
 log = logging.getLogger('model')
 
+# dice rolled by a player and the moves played with them
+Turn = collections.namedtuple('Turn', ['color', 'dice', 'moves'])
+
+# kinds of events published by games, turn-started carries the color of the
+# player to move, move-made the color and the moves, game-over the winner
+TURN_STARTED = 'turn-started'
+MOVE_MADE = 'move-made'
+GAME_OVER = 'game-over'
+
 
 class Game(Observable):
     class LogicError(Exception):
@@ -54,6 +70,7 @@ class Game(Observable):
 
             self._game = game
             self._color = color
+            self._subscriptions = []
             self._game.add_observer(self)
 
         def __enter__(self):
@@ -61,10 +78,24 @@ class Game(Observable):
 
         def __exit__(self, exc_type, exc_value, exl_traceback):
             self._game.remove_observer(self)
+            for subscription in self._subscriptions:
+                self._game.unsubscribe(subscription)
+
+        # callback(event) is called when a turn of the player starts, other
+        # events of the game do not wake it
+        def subscribe_turns(self, callback):
+            color = self._color
+            subscription = self._game.subscribe(callback, (TURN_STARTED,),
+                    lambda event: event.data == color)
+            self._subscriptions.append(subscription)
+            return subscription
 
         def move(self, position, distance):
             self._game.move(self._color, position, distance)
 
+        def play_turn(self, moves):
+            self._game.play_turn(self._color, moves)
+
         def update(self, observable):
             assert observable is self._game
             self.set_changed()
@@ -85,21 +116,38 @@ class Game(Observable):
         def board(self):
             return self._game.board
 
-    def __init__(self, _dice_roller=None, _starting_player=None, _board=None):
+        # legal moves and turns of the player, empty when it is not their turn
+        @property
+        def legal_moves(self):
+            return self._game.legal_moves(self._color)
+
+        @property
+        def legal_turns(self):
+            return self._game.legal_turns(self._color)
+
+    def __init__(self, _dice_roller=None, _starting_player=None, _board=None,
+            _synchronous=False):
         super().__init__()
 
-        self._game_mutex = threading.RLock()
-        self._board = _board or INIT_BOARD.copy()
+        # synchronous games are driven turn by turn from a single thread, so
+        # they neither lock nor notify observers
+        self._synchronous = _synchronous
+        self._game_mutex = contextlib.nullcontext() if _synchronous \
+            else threading.RLock()
+        self._board = Board(_board or INIT_BOARD)
         self._active_player = _starting_player \
             or random.sample(('w', 'b'), 1)[0]
 
         self._roll_dice = _dice_roller or (lambda: (roll_dice(), roll_dice()))
 
-        self._dice = list(self._roll_dice())
+        self._history = []
+        self._legal_moves = None
+        self._legal_turns = None
+        self._roll()
 
     @property
     def board(self):
-        return self._board.copy()
+        return self._board
 
     @property
     def active_player(self):
@@ -109,6 +157,45 @@ class Game(Observable):
     def dice(self):
         return self._dice.copy()
 
+    # Zobrist key of the board and the player to move
+    @property
+    def key(self):
+        with self._game_mutex:
+            return position_key(self._board, self._active_player)
+
+    @property
+    def history(self):
+        with self._game_mutex:
+            return [Turn(color, dice, tuple(moves))
+                for color, dice, moves in self._history]
+
+    # single (position, distance) moves the active player can make, computed
+    # once per position and dice
+    def legal_moves(self, color=None):
+        with self._game_mutex:
+            if color not in (None, self._active_player) \
+                    or get_winner(self._board) is not None:
+                return []
+
+            if self._legal_moves is None:
+                self._legal_moves = legal_moves(self._board, self._dice,
+                        self._active_player)
+            return list(self._legal_moves)
+
+    # sequences of moves playing the rest of the turn, one for each position
+    # they lead to
+    def legal_turns(self, color=None):
+        with self._game_mutex:
+            if color not in (None, self._active_player) \
+                    or get_winner(self._board) is not None:
+                return []
+
+            if self._legal_turns is None:
+                self._legal_turns = [tuple(history) for history, _ in
+                    unique_available_moves(self._board, self._dice,
+                        self._active_player)]
+            return list(self._legal_turns)
+
     def move(self, color, position, distance):
         with self._game_mutex:
             player = self._active_player
@@ -125,34 +212,117 @@ class Game(Observable):
             if abs(distance) not in dice:
                 raise Game.LogicError('move is invalid')
 
+            if self._legal_moves is not None \
+                    and (position, distance) not in self._legal_moves:
+                raise Game.LogicError('move is invalid')
+
             new_board = make_move(board, position, distance, player)
 
             if new_board is None:
                 raise Game.LogicError('move is invalid')
 
             self._board = new_board
+            self._legal_moves = None
+            self._legal_turns = None
             dice.remove(abs(distance))
+            self._history[-1][2].append((position, distance))
 
-            if len(dice) == 0:
-                self._next_player()
-            elif not is_any_legal_move(self._board, self._dice,
-                    self._active_player):
+            events = [(MOVE_MADE, (color, ((position, distance),)))]
+
+            if len(dice) == 0 or not is_any_legal_move(self._board,
+                    self._dice, self._active_player):
                 self._next_player()
+                events.append(self._turn_event())
 
             log.debug("{}: move {} {}".format(color, position, distance))
 
-            self.set_changed()
-            self.notify_observers()
+            self._announce(events)
+
+    # tells observers the game has started, no move can be made before all of
+    # them are told
+    def start(self):
+        with self._game_mutex:
+            self._announce([self._turn_event()])
+
+    # plays a whole turn at once, observers are notified once and nothing is
+    # changed when any of the moves is invalid or the turn is not finished
+    def play_turn(self, color, moves):
+        with self._game_mutex:
+            if get_winner(self._board) is not None:
+                self._active_player = None
+                raise Game.LogicError('game has ended')
+
+            if color != self._active_player:
+                raise Game.LogicError('not players turn')
+
+            board = self._board
+            dice = list(self._dice)
+
+            for position, distance in moves:
+                if abs(distance) not in dice:
+                    raise Game.LogicError('move is invalid')
+
+                board = make_move(board, position, distance, color)
+
+                if board is None:
+                    raise Game.LogicError('move is invalid')
+
+                dice.remove(abs(distance))
+
+            if dice and get_winner(board) is None \
+                    and is_any_legal_move(board, dice, color):
+                raise Game.LogicError('turn is not finished')
+
+            self._board = board
+            self._dice = dice
+            self._legal_moves = None
+            self._legal_turns = None
+            self._history[-1][2].extend(moves)
+
+            self._next_player()
+
+            log.debug("{}: turn {}".format(color, moves))
+
+            self._announce([(MOVE_MADE, (color, tuple(moves))),
+                self._turn_event()])
+
+    def _turn_event(self):
+        winner = get_winner(self._board)
+        if winner is not None:
+            return GAME_OVER, winner
+        return TURN_STARTED, self._active_player
+
+    # publishes (kind, data) events to subscribers, then tells observers the
+    # game has changed
+    def _announce(self, events):
+        if self._synchronous:
+            return
+
+        for kind, data in events:
+            self.publish(kind, data)
+
+        self.set_changed()
+        self.notify_observers()
 
     def _next_player(self):
-        if get_winner(self._board) is None:
+        if get_winner(self._board) is not None:
+            # nobody moves once the game has ended
+            self._active_player = None
+        else:
             with self._game_mutex:
                 self._active_player = enemy(self._active_player)
-                self._dice = list(self._roll_dice())
+                self._roll()
                 if not is_any_legal_move(self._board, self._dice,
                         self._active_player):
                     self._next_player()
 
+    def _roll(self):
+        dice = tuple(self._roll_dice())
+        self._dice = dice_moves(dice)
+        self._legal_moves = None
+        self._legal_turns = None
+        self._history.append((self._active_player, dice, []))
+
     def get_player(self, color):
         assert color in ('w', 'b')
         return Game.Player(self, color)
@@ -162,4 +332,4 @@ class Game(Observable):
         return get_winner(self._board)
 
     def __str__(self):
-        return str(self.board)
+        return str(self._board.to_list())
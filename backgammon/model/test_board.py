@@ -0,0 +1,164 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import copy
+import unittest
+
+import backgammon.model.config as config
+import backgammon.model.utils as utils
+
+from backgammon.model.board import Board
+from backgammon.model.board import SearchBoard
+
+
+class TestBoard(unittest.TestCase):
+    def test_list_conversion(self):
+        board = Board.from_list(config.INIT_BOARD)
+        self.assertEqual(board.to_list(), config.INIT_BOARD)
+        self.assertEqual(len(board), len(config.INIT_BOARD))
+        self.assertEqual(list(board), config.INIT_BOARD)
+
+    def test_hash(self):
+        p = Board(config.INIT_BOARD)
+        q = Board(list(config.INIT_BOARD))
+        self.assertEqual(p, q)
+        self.assertEqual(hash(p), hash(q))
+        self.assertEqual(len({p, q}), 1)
+
+    def test_replace(self):
+        board = Board(config.INIT_BOARD)
+        new_board = board.replace([(1, 1), (2, 1)])
+
+        self.assertEqual(board.to_list(), config.INIT_BOARD)
+        self.assertEqual(new_board[1:3], (1, 1))
+        self.assertNotEqual(board, new_board)
+
+    def test_copy_is_identity(self):
+        board = Board(config.INIT_BOARD)
+        self.assertIs(copy.copy(board), board)
+        self.assertIs(board.copy(), board)
+
+    def test_make_move(self):
+        board = Board(config.INIT_BOARD)
+
+        for position, distance, player in ((1, 1, 'w'), (6, 1, 'b'),
+                (1, 5, 'w'), (1, 1, 'b')):
+            new_board = utils.make_move(board, position, distance, player)
+            expected = utils.make_move(config.INIT_BOARD, position, distance,
+                    player)
+
+            if expected is None:
+                self.assertIsNone(new_board)
+            else:
+                self.assertIsInstance(new_board, Board)
+                self.assertEqual(new_board.to_list(), expected)
+
+    def test_is_home(self):
+        board = [0] * 26
+        board[19] = 2
+        board[6] = -1
+
+        self.assertTrue(Board(board).is_home('w'))
+        self.assertTrue(Board(board).is_home('b'))
+
+        board[18] = 1
+        self.assertFalse(Board(board).is_home('w'))
+        self.assertTrue(Board(board).is_home('b'))
+
+    def test_incremental_tracking(self):
+        board = Board(config.INIT_BOARD)
+
+        for position, distance, player in ((1, 6, 'w'), (24, 6, 'b'),
+                (17, 1, 'w'), (25, 2, 'b'), (12, 4, 'w'), (6, 5, 'b')):
+            board = utils.make_move(board, position, distance, player)
+            fresh = Board(board.to_list())
+
+            for color in utils.players():
+                self.assertEqual(board.is_home(color), fresh.is_home(color))
+                self.assertEqual(list(board.occupied(color)),
+                        list(fresh.occupied(color)))
+                self.assertEqual(board.checkers(color), fresh.checkers(color))
+                self.assertEqual(board.pips(color), fresh.pips(color))
+            self.assertEqual(board.has_contact(), fresh.has_contact())
+            self.assertEqual(board.key, fresh.key)
+
+    def test_pips(self):
+        board = Board(config.INIT_BOARD)
+        for color in utils.players():
+            self.assertEqual(board.pips(color), 167)
+            self.assertEqual(board.checkers(color), 15)
+
+    def test_has_contact(self):
+        board = [0] * 26
+        board[10] = 2
+        board[9] = -1
+
+        self.assertFalse(Board(board).has_contact())
+
+        board[0] = 1
+        self.assertTrue(Board(board).has_contact())
+
+        board[0] = 0
+        board[25] = -1
+        self.assertTrue(Board(board).has_contact())
+
+    def test_search_board_apply_undo(self):
+        board = Board(config.INIT_BOARD)
+        search_board = SearchBoard(board)
+        undos = []
+
+        for position, distance, player in ((1, 6, 'w'), (24, 6, 'b'),
+                (17, 1, 'w'), (25, 2, 'b'), (12, 4, 'w'), (6, 5, 'b')):
+            board = utils.make_move(board, position, distance, player)
+            undos.append(utils.apply_move(search_board, position, distance,
+                    player))
+
+            snapshot = search_board.snapshot()
+            self.assertEqual(snapshot, board)
+            for color in utils.players():
+                self.assertEqual(snapshot.pips(color), board.pips(color))
+                self.assertEqual(snapshot.is_home(color),
+                        board.is_home(color))
+
+        self.assertIsNone(utils.apply_move(search_board, 1, 1, 'w'))
+
+        for undo in reversed(undos):
+            utils.undo_move(search_board, undo)
+
+        self.assertEqual(search_board.snapshot(), Board(config.INIT_BOARD))
+        self.assertEqual(search_board.key, Board(config.INIT_BOARD).key)
+        self.assertEqual(search_board.pips('w'), 167)
+
+    def test_position_key(self):
+        board = Board(config.INIT_BOARD)
+        keys = {utils.position_key(board, color) for color in utils.players()}
+        self.assertEqual(len(keys), 2)
+
+        self.assertEqual(utils.position_key(config.INIT_BOARD, 'w'), board.key)
+        self.assertNotEqual(
+                utils.make_move(board, 1, 1, 'w').key, board.key)
@@ -29,7 +29,12 @@
 import unittest
 from unittest.mock import MagicMock
 
+from backgammon.model.config import INIT_BOARD
+from backgammon.model.game import GAME_OVER
+from backgammon.model.game import MOVE_MADE
+from backgammon.model.game import TURN_STARTED
 from backgammon.model.game import Game
+from backgammon.model.utils import position_key
 
 
 class TestGame(unittest.TestCase):
@@ -46,3 +51,138 @@ class TestGame(unittest.TestCase):
 
         game.move('w', 1, 3)
         game.move('w', 1, 3)
+
+    def test_double_moves_four_times(self):
+        game = Game(_dice_roller=MagicMock(return_value=(3, 3)),
+                _starting_player='w')
+
+        self.assertEqual(game.dice, [3, 3, 3, 3])
+        for position in (1, 1, 12, 12):
+            self.assertEqual(game.active_player, 'w')
+            game.move('w', position, 3)
+
+        self.assertEqual(game.active_player, 'b')
+        self.assertEqual(game.dice, [3, 3, 3, 3])
+
+    def test_key(self):
+        game = Game(_dice_roller=MagicMock(return_value=(1, 2)),
+                _starting_player='w')
+        key = game.key
+
+        game.move('w', 1, 1)
+        self.assertNotEqual(game.key, key)
+
+        game.move('w', 1, 2)
+        self.assertEqual(game.active_player, 'b')
+        self.assertEqual(game.key, position_key(game.board, 'b'))
+
+    def test_legal_moves(self):
+        game = Game(_dice_roller=MagicMock(return_value=(6, 5)),
+                _starting_player='w')
+        player = game.get_player('w')
+
+        moves = player.legal_moves
+        self.assertIn((1, 6), moves)
+        self.assertIn((12, 5), moves)
+        self.assertNotIn((1, 5), moves)
+        self.assertEqual(game.get_player('b').legal_moves, [])
+
+        with self.assertRaises(Game.LogicError):
+            game.move('w', 1, 5)
+
+        game.move('w', 1, 6)
+        self.assertEqual({distance for _, distance in player.legal_moves},
+                {5})
+
+    def test_legal_turns(self):
+        game = Game(_dice_roller=MagicMock(return_value=(6, 5)),
+                _starting_player='w')
+
+        turns = game.get_player('w').legal_turns
+        self.assertIn(((1, 6), (7, 5)), turns)
+
+        for position, distance in turns[0]:
+            game.move('w', position, distance)
+        self.assertEqual(game.active_player, 'b')
+
+    def test_play_turn(self):
+        game = Game(_dice_roller=MagicMock(return_value=(6, 5)),
+                _starting_player='w')
+        observer = MagicMock()
+        game.add_observer(observer)
+
+        game.get_player('w').play_turn([(1, 6), (7, 5)])
+
+        self.assertEqual(observer.update.call_count, 1)
+        self.assertEqual(game.active_player, 'b')
+        self.assertEqual(game.board[1], INIT_BOARD[1] - 1)
+        self.assertEqual(game.board[12], INIT_BOARD[12] + 1)
+        self.assertEqual(game.history[0].moves, ((1, 6), (7, 5)))
+
+    def test_play_turn_keeps_game_on_error(self):
+        game = Game(_dice_roller=MagicMock(return_value=(6, 5)),
+                _starting_player='w')
+        observer = MagicMock()
+        game.add_observer(observer)
+        board = game.board
+
+        for moves in ([(1, 6)], [(1, 6), (7, 4)], [(6, 6), (1, 5)],
+                [(1, 6), (7, 5), (12, 5)]):
+            with self.assertRaises(Game.LogicError):
+                game.play_turn('w', moves)
+
+        with self.assertRaises(Game.LogicError):
+            game.play_turn('b', [(24, -6), (18, -5)])
+
+        self.assertEqual(observer.update.call_count, 0)
+        self.assertEqual(game.active_player, 'w')
+        self.assertEqual(game.board, board)
+        self.assertEqual(game.dice, [6, 5])
+        self.assertEqual(game.history[0].moves, ())
+
+    def test_events(self):
+        game = Game(_dice_roller=MagicMock(return_value=(6, 5)),
+                _starting_player='w')
+        white = MagicMock()
+        black = MagicMock()
+        events = MagicMock()
+        game.get_player('w').subscribe_turns(white)
+        game.get_player('b').subscribe_turns(black)
+        game.subscribe(events)
+
+        game.start()
+        self.assertEqual(white.call_count, 1)
+        self.assertEqual(black.call_count, 0)
+
+        game.move('w', 1, 6)
+        game.move('w', 7, 5)
+        self.assertEqual(white.call_count, 1)
+        self.assertEqual(black.call_count, 1)
+
+        self.assertEqual([(c.args[0].kind, c.args[0].data)
+                    for c in events.call_args_list],
+                [(TURN_STARTED, 'w'), (MOVE_MADE, ('w', ((1, 6),))),
+                    (MOVE_MADE, ('w', ((7, 5),))), (TURN_STARTED, 'b')])
+
+    def test_game_over_event(self):
+        board = [0] * 26
+        board[24] = 1
+        board[1] = -1
+        game = Game(_dice_roller=MagicMock(return_value=(6, 5)),
+                _starting_player='w', _board=board)
+        events = MagicMock()
+        game.subscribe(events, (GAME_OVER,))
+
+        game.play_turn('w', [(24, 6)])
+
+        self.assertEqual([(c.args[0].kind, c.args[0].data)
+                    for c in events.call_args_list],
+                [(GAME_OVER, 'w')])
+
+    def test_player_exit_unsubscribes(self):
+        game = Game()
+        player = game.get_player('w')
+        with player:
+            player.subscribe_turns(MagicMock())
+            self.assertEqual(game.count_subscribers(), 1)
+        self.assertEqual(game.count_subscribers(), 0)
@@ -27,11 +27,15 @@
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import copy
+import itertools
 import unittest
 
 import backgammon.model.utils as utils
 import backgammon.model.config as config
 
+from backgammon.model.board import Board
+from backgammon.model.board import SearchBoard
+
 
 class TestUtils(unittest.TestCase):
     def test_player_modifier(self):
@@ -125,6 +129,13 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(utils.make_move(board_start, start, 1, player),
                 board_end)
 
+    def test_make_move_zero_distance(self):
+        for start, player in ((1, 'w'), (6, 'b')):
+            self.assertEqual(utils.make_move(config.INIT_BOARD, start, 0,
+                    player), config.INIT_BOARD)
+            self.assertEqual(utils.make_move(Board(config.INIT_BOARD), start,
+                    0, player), Board(config.INIT_BOARD))
+
     def test_make_invalid_move_black(self):
         player = 'b'
         start = 1
@@ -207,3 +218,108 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(moves, {
             ((5, 1), ),
         })
+
+    def assert_same_positions(self, board, dices, player):
+        expected = {tuple(b) for _, b in
+                utils.available_moves(board, dices, player)}
+        boards = [tuple(b) for _, b in
+                utils.unique_available_moves(board, dices, player)]
+
+        self.assertEqual(len(boards), len(set(boards)))
+        self.assertEqual(set(boards), expected)
+
+    def test_unique_available_moves(self):
+        for player in utils.players():
+            for dices in itertools.combinations_with_replacement(
+                    range(1, 7), 2):
+                self.assert_same_positions(config.INIT_BOARD, dices, player)
+
+    def test_unique_available_moves_from_jail(self):
+        board = [0] * 26
+
+        board[0] = 1
+        board[3] = -2
+        board[5] = 1
+        board[7] = -1
+        board[20] = 2
+
+        for dices in itertools.combinations_with_replacement(range(1, 7), 2):
+            self.assert_same_positions(board, dices, 'w')
+
+    def test_unique_available_moves_with_unusable_dice(self):
+        board = [0] * 26
+
+        board[5] = 1
+        board[7] = -2
+        board[8] = -2
+
+        self.assert_same_positions(board, (1, 2), 'w')
+
+    def test_unique_double_moves(self):
+        board = [0] * 26
+
+        board[0] = 1
+        board[3] = -2
+        board[5] = 1
+        board[7] = -1
+        board[20] = 2
+
+        for start in (config.INIT_BOARD, board):
+            for player in utils.players():
+                for distance in range(1, 7):
+                    dices = utils.dice_moves((distance, distance))
+                    expected = {b for _, b in utils._unique_available_moves(
+                            SearchBoard(start), dices, player, [], set())}
+                    boards = {b for _, b in utils.unique_available_moves(
+                            start, dices, player)}
+
+                    self.assertEqual(boards, expected)
+
+    def test_dice_moves(self):
+        self.assertEqual(utils.dice_moves((2, 5)), [2, 5])
+        self.assertEqual(utils.dice_moves((4, 4)), [4, 4, 4, 4])
+
+    def test_unique_available_moves_history(self):
+        for history, board in utils.unique_available_moves(config.INIT_BOARD,
+                (3, 1), 'w'):
+            replayed = config.INIT_BOARD
+            for position, distance in history:
+                replayed = utils.make_move(replayed, position, distance, 'w')
+            self.assertEqual(replayed, list(board))
+
+    def test_mirror(self):
+        board = list(config.INIT_BOARD)
+        board[0] = 1
+        board[1] = 1
+        board[25] = -2
+        board[24] = 0
+
+        mirrored = utils.mirror(board)
+        self.assertEqual(utils.mirror(mirrored), board)
+        self.assertEqual(utils.canonical(board, 'b'), (mirrored, 'w'))
+
+        for dices in ((6, 5), (2, 2)):
+            moves = {tuple(utils.mirror(b)) for _, b in
+                    utils.unique_available_moves(board, dices, 'b')}
+            mirrored_moves = {b.fields for _, b in
+                    utils.unique_available_moves(mirrored, dices, 'w')}
+            self.assertEqual(moves, mirrored_moves)
+
+    def test_canonical_key(self):
+        board = utils.make_move(config.INIT_BOARD, 1, 3, 'w')
+        mirrored = utils.mirror(board)
+
+        self.assertEqual(utils.canonical_key(board, 'b'),
+                utils.canonical_key(mirrored, 'w'))
+        self.assertNotEqual(utils.canonical_key(board, 'w'),
+                utils.canonical_key(board, 'b'))
+
+    def test_legal_moves_of_lists(self):
+        for player, dice in (('w', [6, 5]), ('b', [3, 3, 3, 3])):
+            self.assertEqual(utils.legal_moves(config.INIT_BOARD, dice,
+                    player),
+                    utils.legal_moves(Board(config.INIT_BOARD), dice, player))
+
+        board = list(config.INIT_BOARD)
+        board[0] = 1
+        self.assertEqual(utils.legal_moves(board, [6, 5], 'w'), [(0, 5)])
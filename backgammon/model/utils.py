@@ -26,11 +26,16 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import collections
 import itertools as it
 import random
 
 from copy import copy
 
+from backgammon.model.board import BLACK_TO_MOVE
+from backgammon.model.board import Board
+from backgammon.model.board import SearchBoard
+
 from utils.math import signum
 
 
@@ -38,6 +43,20 @@ def roll_dice():
     return random.randint(1, 6)
 
 
+# distances a player moves with after rolling dices, doubles are played
+# four times
+def dice_moves(dices):
+    if len(dices) == 2 and dices[0] == dices[1]:
+        return [dices[0]] * 4
+    return list(dices)
+
+
+# moves of every unordered roll of two dice with its probability
+DICE_OUTCOMES = tuple(
+    (tuple(dice_moves(dices)), 1/36 if dices[0] == dices[1] else 1/18)
+    for dices in it.combinations_with_replacement(range(1, 7), 2))
+
+
 def players():
     return ['w', 'b']
 
@@ -96,71 +115,174 @@ def get_winner(board):
     return None
 
 
+_Rules = collections.namedtuple('_Rules', ['modifier', 'jail', 'enemy_jail',
+    'non_home', 'offboard', 'positions'])
+
+_RULES = {
+    player: _Rules(
+        modifier=player_modifier(player),
+        jail=jail_field(player),
+        enemy_jail=jail_field(enemy(player)),
+        non_home=range(*non_home_fields(player).indices(26)),
+        # position * modifier above it goes offboard
+        offboard=24 if player == 'w' else -1,
+        # from the jail in the direction of moves
+        positions=tuple(range(0, 26)) if player == 'w'
+            else tuple(range(25, -1, -1)),
+    )
+    for player in players()
+}
+
+
+def _is_home(board, player):
+    if isinstance(board, (Board, SearchBoard)):
+        return board.is_home(player)
+
+    modifier = _RULES[player].modifier
+    for field in _RULES[player].non_home:
+        if board[field] * modifier > 0:
+            return False
+    return True
+
+
+# Zobrist key of board with player to move
+def position_key(board, player):
+    if not isinstance(board, (Board, SearchBoard)):
+        board = Board(board)
+    return board.key ^ (BLACK_TO_MOVE if player == 'b' else 0)
+
+
+# The position of a board with black to move is the same as that of the
+# board with the colors swapped and the fields reversed with white to move,
+# canonical positions are always seen from white.
+
+def mirror(board):
+    fields = board.fields if isinstance(board, (Board, SearchBoard)) \
+        else board
+    mirrored = [-k for k in reversed(fields)]
+    return mirrored if isinstance(board, list) else Board(mirrored)
+
+
+# board and player to move oriented so that white is to move
+def canonical(board, player):
+    if player == 'w':
+        return board, 'w'
+    return mirror(board), 'w'
+
+
+# key of the canonical position, the same for a position and its mirror
+def canonical_key(board, player):
+    if not isinstance(board, Board):
+        board = Board(board)
+    return board.key if player == 'w' else board.mirror_key
+
+
 def verify_move(board, position, distance, player):
-    distance = distance * player_modifier(player)
-    new_position = position + distance
+    rules = _RULES[player]
+    modifier = rules.modifier
+    fields = board.fields if isinstance(board, (Board, SearchBoard)) \
+        else board
 
-    if position not in board_range() \
-            and position != jail_field(player):
+    if not 0 <= distance <= 6:
         return False
 
-    if distance not in valid_distance(player):
+    if fields[rules.jail]:
+        if position != rules.jail:
+            return False
+    elif not 1 <= position <= 24 or fields[position] * modifier <= 0:
         return False
 
-    if position in board_range() \
-            and signum(board[position]) != player_modifier(player):
-        return False
+    new_position = position + distance * modifier
 
-    if position == jail_field(player) \
-            and board[jail_field(player)] == 0:
-        return False
+    if new_position * modifier > rules.offboard:
+        return _is_home(board, player)
 
-    if board[jail_field(player)] and position != jail_field(player):
-        return False
+    return fields[new_position] * modifier >= -1
 
-    if goes_offboard(player, new_position):
-        for field in board[non_home_fields(player)]:
-            if player_from_number(field) == player:
-                return False
 
-    if not goes_offboard(player, new_position) \
-            and board[new_position] * player_modifier(enemy(player)) > 1:
-        return False
+# (position, value) changes of the fields a move makes, None when it is not
+# legal
+def _move_changes(board, position, distance, player):
+    if not verify_move(board, position, distance, player):
+        return None
 
-    return True
+    rules = _RULES[player]
+    checker = rules.modifier
+    new_position = position + distance * checker
+    fields = board.fields if isinstance(board, (Board, SearchBoard)) \
+        else board
+
+    changes = [(position, fields[position] - checker)]
+    if 1 <= new_position <= 24:
+        # a move of distance 0 lands where the checker was taken from
+        target = fields[new_position] - checker \
+            if new_position == position else fields[new_position]
+        if target == -checker:
+            changes.append((rules.enemy_jail,
+                    fields[rules.enemy_jail] - checker))
+            changes.append((new_position, checker))
+        else:
+            changes.append((new_position, target + checker))
+
+    return changes
 
 
 def make_move(board, position, distance, player):
-    if not verify_move(board, position, distance, player):
+    changes = _move_changes(board, position, distance, player)
+    if changes is None:
         return None
 
-    new_position = position + distance * player_modifier(player)
-    board = board.copy()
-    checker = player_modifier(player)
+    if isinstance(board, Board):
+        return board.replace(changes)
 
-    board[position] -= checker
-    if new_position in board_range():
-        if signum(board[new_position] == player_modifier(enemy(player))):
-            board[jail_field(enemy(player))] += board[new_position]
-            board[new_position] = 0
-        board[new_position] += checker
+    board = board.copy()
+    for field, value in changes:
+        board[field] = value
 
     return board
 
 
+# plays a move on a SearchBoard in place, returns what undo_move needs to
+# take it back or None when the move is not legal
+def apply_move(board, position, distance, player):
+    changes = _move_changes(board, position, distance, player)
+    if changes is None:
+        return None
+    return board.apply(changes)
+
+
+def undo_move(board, undo):
+    board.undo(undo)
+
+
 def is_any_legal_move(board, dice, player):
-    if board[jail_field(player)]:
+    rules = _RULES[player]
+    dice = set(dice)
+
+    if board[rules.jail]:
+        positions = (rules.jail, )
+    elif isinstance(board, (Board, SearchBoard)):
+        positions = board.occupied(player)
+    else:
+        positions = (k for k in board_range()
+                if board[k] * rules.modifier > 0)
+
+    for position in positions:
         for distance in dice:
-            if verify_move(board, jail_field(player), distance, player):
+            if verify_move(board, position, distance, player):
                 return True
-    else:
-        for position in board_range():
-            for distance in dice:
-                if verify_move(board, position, distance, player):
-                    return True
     return False
 
 
+# single moves player can make with any of the dice
+def legal_moves(board, dice, player):
+    positions = _movable(board, player)
+    return [(position, distance)
+        for position in positions
+        for distance in sorted(set(dice))
+        if verify_move(board, position, distance, player)]
+
+
 def player_fields(board, player):
     for i, field in enumerate(board):
         if player_from_number(player) == player:
@@ -191,3 +313,106 @@ def available_moves(board, dices, player, history=[]):
 
     if not yielded:
         yield copy(history), copy(board)
+
+
+def unique_available_moves(board, dices, player):
+    yielded_boards = set()
+    visited = set()
+    search_board = SearchBoard(board)
+
+    if len(dices) > 1 and len(set(dices)) == 1:
+        moves = _unique_double_moves(search_board, dices[0], len(dices),
+                player, 0, [], visited)
+    else:
+        moves = _unique_available_moves(search_board, list(dices), player, [],
+                visited)
+
+    for history, new_board in moves:
+        if new_board not in yielded_boards:
+            yielded_boards.add(new_board)
+            yield history, new_board
+
+
+# positions player may move a checker from, in increasing order
+def _movable(board, player):
+    rules = _RULES[player]
+    if board[rules.jail]:
+        return (rules.jail, )
+    if isinstance(board, (Board, SearchBoard)):
+        return list(board.occupied(player))
+    return [k for k in board_range() if board[k] * rules.modifier > 0]
+
+
+# Both generators below play moves on a SearchBoard in place and take them
+# back, a Board is only made of the positions they yield.
+
+def _unique_available_moves(board, dices, player, history, visited):
+    # the set of positions reachable from a board depends only on the board
+    # and the remaining dice, so every such state is expanded only once,
+    # boards are told apart by their Zobrist keys
+    state = (board.key, tuple(sorted(dices)))
+    if state in visited:
+        return
+    visited.add(state)
+
+    if not dices:
+        yield list(history), board.snapshot()
+        return
+
+    moved = False
+
+    positions = _movable(board, player)
+
+    for dice in set(dices):
+        new_dices = list(dices)
+        new_dices.remove(dice)
+
+        for position in positions:
+            undo = apply_move(board, position, dice, player)
+            if undo is not None:
+                moved = True
+                history.append((position, dice))
+                yield from _unique_available_moves(board, new_dices, player,
+                        history, visited)
+                history.pop()
+                undo_move(board, undo)
+
+    if not moved:
+        yield list(history), board.snapshot()
+
+
+def _unique_double_moves(board, distance, count, player, start, history,
+        visited):
+    # the same positions are reached whatever order checkers are moved in, so
+    # only moves from positions not behind the previous one are tried
+    state = (board.key, count, start)
+    if state in visited:
+        return
+    visited.add(state)
+
+    if not count:
+        yield list(history), board.snapshot()
+        return
+
+    rules = _RULES[player]
+    positions = rules.positions
+    fields = board.fields
+    moved = False
+
+    for i in range(start, 26):
+        position = positions[i]
+        if fields[position] * rules.modifier <= 0:
+            continue
+
+        undo = apply_move(board, position, distance, player)
+        if undo is not None:
+            moved = True
+            history.append((position, distance))
+            yield from _unique_double_moves(board, distance, count - 1,
+                    player, i, history, visited)
+            history.pop()
+            undo_move(board, undo)
+
+    # a move from behind means the dice can still be used in another order
+    if not moved and not is_any_legal_move(board, (distance, ), player):
+        yield list(history), board.snapshot()
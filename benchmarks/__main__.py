@@ -0,0 +1,92 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import argparse
+import json
+import os
+import sys
+
+import benchmarks.suite as suite
+
+# reference results at scale 1, --baseline without a file compares against
+# them, they are only comparable on similar machines
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('--output', '-o', help='write results as JSON')
+    parser.add_argument('--baseline', '-b', nargs='?', const=BASELINE,
+            help='compare against results stored in JSON, the committed '
+            'reference results by default')
+    parser.add_argument('--save-baseline', action='store_true',
+            help='write results to the baseline file instead of comparing')
+    parser.add_argument('--tolerance', '-t', type=float, default=0.2)
+    parser.add_argument('--scale', '-s', type=int, default=1)
+    parser.add_argument('--only', nargs='+', choices=suite.names(),
+            metavar='NAME')
+    args = parser.parse_args()
+
+    def log(name, result):
+        print('{:45} {:12.6f} {}'.format(name, result.value, result.unit))
+        sys.stdout.flush()
+
+    baseline = None
+    if args.baseline and not args.save_baseline:
+        with open(args.baseline) as baseline_file:
+            baseline_data = json.load(baseline_file)
+
+        if baseline_data['meta']['scale'] != args.scale:
+            sys.exit('{} was recorded at scale {}'.format(args.baseline,
+                    baseline_data['meta']['scale']))
+        baseline = suite.load(baseline_data)
+
+    results = suite.run(args.only, args.scale, log)
+    data = suite.dump(results, args.scale)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(data, output, indent=4)
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, 'w') as output:
+            json.dump(data, output, indent=4)
+    elif baseline is not None:
+        regressions = 0
+        for name, slowdown, regression in suite.compare(results, baseline,
+                args.tolerance):
+            print('{:45} {:6.2f}x baseline {}'.format(name, slowdown,
+                    'REGRESSION' if regression else ''))
+            regressions += regression
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
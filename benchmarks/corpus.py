@@ -0,0 +1,64 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import random
+
+import backgammon.model.config as config
+import backgammon.model.utils as utils
+
+from backgammon.model.board import Board
+
+
+def positions(count, seed=0):
+    rng = random.Random(seed)
+    board = config.INIT_BOARD
+    player = 'w'
+    result = []
+
+    while len(result) < count:
+        dice = utils.dice_moves((rng.randint(1, 6), rng.randint(1, 6)))
+        moves = list(utils.unique_available_moves(board, dice, player))
+        _, board = rng.choice(moves)
+        board = list(board)
+        player = utils.enemy(player)
+
+        if utils.get_winner(board) is not None:
+            board = config.INIT_BOARD
+        result.append((board, player))
+
+    return result
+
+
+def board_positions(count, seed=0):
+    return [(Board(board), player) for board, player in positions(count, seed)]
+
+
+def dices(count, seed=0):
+    rng = random.Random(seed)
+    return [utils.dice_moves((rng.randint(1, 6), rng.randint(1, 6)))
+        for _ in range(count)]
@@ -0,0 +1,82 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import timeit
+
+import backgammon.model.utils as utils
+import benchmarks.legacy as legacy
+
+from benchmarks.corpus import board_positions
+from benchmarks.corpus import positions
+
+
+def bench(module, corpus, number):
+    def verify():
+        for board, player in corpus:
+            for position in range(26):
+                module.verify_move(board, position, 3, player)
+
+    def make():
+        for board, player in corpus:
+            for position in range(26):
+                module.make_move(board, position, 3, player)
+
+    def any_legal():
+        for board, player in corpus:
+            module.is_any_legal_move(board, (3, 5), player)
+
+    return {
+        name: min(timeit.repeat(function, number=number, repeat=5)) / number
+        for name, function in (('verify_move', verify),
+                ('make_move', make), ('is_any_legal_move', any_legal))
+    }
+
+
+def main(count=200, number=20):
+    corpus = positions(count)
+    board_corpus = board_positions(count)
+
+    results = {
+        'legacy': bench(legacy, corpus, number),
+        'list': bench(utils, corpus, number),
+        'Board': bench(utils, board_corpus, number),
+    }
+
+    for name in results['legacy']:
+        baseline = results['legacy'][name]
+        print('{:20}'.format(name), end=' ')
+        for variant, timings in results.items():
+            print('{:>8} {:8.3f}ms ({:4.1f}x)'.format(variant,
+                    timings[name] * 1000, baseline / timings[name]), end=' ')
+        print()
+
+    return results
+
+
+if __name__ == '__main__':
+    main()
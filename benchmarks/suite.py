@@ -0,0 +1,267 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import collections
+import contextlib
+import importlib
+import io
+import platform
+import random
+import time
+import timeit
+
+import backgammon.bots.utils.tactics as tactics
+import backgammon.model.utils as utils
+
+from backgammon.bots.utils.minmax import MinMax
+from backgammon.judge.main import play_synchronous
+from backgammon.model.game import GAME_OVER
+from backgammon.model.game import Game
+from backgammon.model.game import TURN_STARTED
+from benchmarks.corpus import board_positions
+from benchmarks.corpus import dices
+
+BOTS = [
+    'backgammon.bots.random',
+    'backgammon.bots.killer',
+    'backgammon.bots.push_forward',
+    'backgammon.bots.doors',
+    'backgammon.bots.killer_push_forward',
+    'backgammon.bots.killer_push_forward_doors',
+    'backgammon.bots.random_tactic',
+]
+
+Result = collections.namedtuple('Result', ['value', 'unit',
+    'higher_is_better'])
+
+_benchmarks = collections.OrderedDict()
+
+
+def benchmark(name):
+    def register(function):
+        _benchmarks[name] = function
+        return function
+    return register
+
+
+def names():
+    return list(_benchmarks)
+
+
+def _time(function, number=1, repeat=3):
+    return Result(min(timeit.repeat(function, number=number,
+            repeat=repeat)) / number, 's', False)
+
+
+@benchmark('verify_move')
+def bench_verify_move(scale):
+    corpus = board_positions(200 * scale)
+
+    def run():
+        for board, player in corpus:
+            for position in range(26):
+                for distance in range(1, 7):
+                    utils.verify_move(board, position, distance, player)
+
+    return _time(run)
+
+
+@benchmark('make_move')
+def bench_make_move(scale):
+    corpus = board_positions(200 * scale)
+
+    def run():
+        for board, player in corpus:
+            for position in range(26):
+                for distance in range(1, 7):
+                    utils.make_move(board, position, distance, player)
+
+    return _time(run)
+
+
+@benchmark('available_moves')
+def bench_available_moves(scale):
+    corpus = list(zip(board_positions(50 * scale), dices(50 * scale)))
+
+    def run():
+        for (board, player), dice in corpus:
+            for _ in utils.unique_available_moves(board, dice, player):
+                pass
+
+    return _time(run)
+
+
+def _bench_maximize(levels, count):
+    corpus = board_positions(count, seed=1)
+
+    def run():
+        for board, player in corpus:
+            # the corpus gives the player to move, the search is done for the
+            # one who has just moved
+            root = utils.enemy(player)
+            min_max = MinMax(lambda b: tactics.tactic_push_forward(b, root),
+                    levels, player=root, bounds=tactics.bounds(
+                        [tactics.tactic_push_forward]))
+            min_max.maximize(board)
+
+    return _time(run, repeat=1)
+
+
+@benchmark('maximize_level_1')
+def bench_maximize_level_1(scale):
+    return _bench_maximize(1, 20 * scale)
+
+
+@benchmark('maximize_level_2')
+def bench_maximize_level_2(scale):
+    return _bench_maximize(2, scale)
+
+
+def _bench_games(module, scale):
+    bot = importlib.import_module(module).Bot
+    games = scale
+
+    started = time.perf_counter()
+    for seed in range(games):
+        random.seed(seed)
+        with contextlib.redirect_stdout(io.StringIO()):
+            play_synchronous(bot, bot)
+    elapsed = time.perf_counter() - started
+
+    return Result(games / elapsed, 'games/s', True)
+
+
+for _module in BOTS:
+    benchmark('games_{}'.format(_module.rsplit('.', 1)[-1]))(
+            lambda scale, module=_module: _bench_games(module, scale))
+
+
+class _Listener:
+    def __init__(self):
+        self.calls = 0
+
+    def update(self, observable):
+        self.calls += 1
+
+    def wake(self, event):
+        self.calls += 1
+
+
+# a game with two bots and a judge, changed by turns of alternating players
+def _bench_notifications(notify, subscribe, scale):
+    game = Game()
+    players = [game.get_player('w'), game.get_player('b')]
+    listeners = [_Listener() for _ in range(3)]
+    subscribe(game, players, listeners)
+    changes = 10000 * scale
+
+    started = time.perf_counter()
+    for i in range(changes):
+        notify(game, 'wb'[i % 2])
+    elapsed = time.perf_counter() - started
+
+    return Result(changes / elapsed, 'notifications/s', True)
+
+
+# every observer is told about every change
+@benchmark('notify_observers')
+def bench_notify_observers(scale):
+    def subscribe(game, players, listeners):
+        for player, listener in zip(players, listeners):
+            player.add_observer(listener)
+        game.add_observer(listeners[2])
+
+    def notify(game, color):
+        game.set_changed()
+        game.notify_observers()
+
+    return _bench_notifications(notify, subscribe, scale)
+
+
+# only the bot whose turn starts is told about it
+@benchmark('publish_events')
+def bench_publish_events(scale):
+    def subscribe(game, players, listeners):
+        for player, listener in zip(players, listeners):
+            player.subscribe_turns(listener.wake)
+        game.subscribe(listeners[2].wake, (GAME_OVER,))
+
+    def notify(game, color):
+        game.publish(TURN_STARTED, color)
+
+    return _bench_notifications(notify, subscribe, scale)
+
+
+def run(selected=None, scale=1, log=None):
+    results = collections.OrderedDict()
+
+    for name, function in _benchmarks.items():
+        if selected and name not in selected:
+            continue
+        results[name] = function(scale)
+        if log is not None:
+            log(name, results[name])
+
+    return results
+
+
+def dump(results, scale):
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'scale': scale,
+        },
+        'results': {name: result._asdict()
+            for name, result in results.items()},
+    }
+
+
+def load(data):
+    return collections.OrderedDict((name, Result(**result))
+            for name, result in data['results'].items())
+
+
+def compare(results, baseline, tolerance):
+    # returns (name, slowdown) for each benchmark present in both, slowdown
+    # above 1 + tolerance is a regression
+    comparison = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        base = baseline[name]
+        if result.higher_is_better:
+            slowdown = base.value / result.value
+        else:
+            slowdown = result.value / base.value
+
+        comparison.append((name, slowdown, slowdown > 1 + tolerance))
+
+    return comparison
@@ -1,41 +1,69 @@
-#!/usr/bin/python3
+#!/usr/bin/env python3
 
-import collections
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import argparse
+import logging
+import os
+import sys
 
-def main():
-    result = collections.defaultdict(lambda: 0)
-    tactics = set()
+from backgammon.judge.aggregate import Aggregate
+from backgammon.judge.aggregate import write_csv
+from backgammon.judge.aggregate import write_json
 
-    with open('matches', 'r') as matches_file:
-        while True:
-            white_line = matches_file.readline()[2:]
-            if not white_line:
-                break
-            black_line = matches_file.readline()[2:]
-            white = frozenset(eval(white_line))
-            black = frozenset(eval(black_line))
-            winner_line = matches_file.readline()
+log = logging.getLogger('Interpret')
 
-            tactics.add(white)
-            tactics.add(black)
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('log', nargs='?', default='matches.rec')
+    parser.add_argument('--index', '-i',
+            help='aggregate kept between runs, LOG.index by default')
+    parser.add_argument('--rebuild', '-r', action='store_true',
+            help='ignore the index and read the whole log')
+    parser.add_argument('--format', '-f', choices=('csv', 'json'),
+            default='csv')
+    parser.add_argument('--verbose', '-v', action='store_true')
+    args = parser.parse_args()
 
-            if 'w' in winner_line:
-                result[(white, black)] += 1
-            elif 'b' in winner_line:
-                result[(black, white)] += 1
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
 
-    print("{:100}".format(""), end=' ')
+    index = args.index or args.log + '.index'
 
-    for second in tactics:
-        print("{:100}".format(str(second)), end=' ')
-    print()
+    if os.path.exists(index) and not args.rebuild:
+        aggregate = Aggregate.load(index)
+    else:
+        aggregate = Aggregate()
 
-    for first in tactics:
-        print("{:100}".format(str(first)), end=' ')
-        for second in tactics:
-            print("{:100}".format(result.get((first, second, ), 0)), end=' ')
-        print()
+    log.info('{} new games'.format(aggregate.update(args.log)))
+    aggregate.save(index)
 
-if __name__ == '__main__':
-    main()
+    if args.format == 'csv':
+        write_csv(aggregate.rows(), sys.stdout)
+    else:
+        write_json(aggregate.rows(), sys.stdout)
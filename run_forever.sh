@@ -1,3 +1,3 @@
 #!/bin/bash
 
-while [ 1 ]; do ./backgammon.py -w backgammon.bots.random_tactic -b backgammon.bots.random_tactic --no-gui | tee -a matches ; done
+exec ./tournament.py -p backgammon.bots.random_tactic backgammon.bots.random_tactic --games 0 --output matches.rec "$@"
@@ -26,14 +26,37 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import collections
+import inspect
 import threading
 import weakref
 
+# something that has happened to source, subscribers pick events by kind
+Event = collections.namedtuple('Event', ['kind', 'source', 'data'])
+
+
+class Subscription:
+    def __init__(self, callback, kinds, accept):
+        # bound methods are referenced weakly, like observers are, so that
+        # subscribing does not keep their objects alive
+        if inspect.ismethod(callback):
+            self._callback = weakref.WeakMethod(callback)
+        else:
+            self._callback = lambda: callback
+        self.kinds = kinds
+        self.accept = accept
+
+    @property
+    def callback(self):
+        return self._callback()
+
 
 class Observable:
     def __init__(self):
         self._observable_mutex = threading.RLock()
         self._observers = weakref.WeakSet()
+        # maps a kind to its subscriptions, None to those taking every kind
+        self._subscriptions = {}
 
     def add_observer(self, observer):
         with self._observable_mutex:
@@ -59,3 +82,47 @@ class Observable:
 
     def count_observers(self):
         return len(self._observers)
+
+    # callback(event) is called for published events of the given kinds, or
+    # of every kind when kinds is None, for which accept(event) is true
+    def subscribe(self, callback, kinds=None, accept=None):
+        subscription = Subscription(callback,
+                None if kinds is None else tuple(kinds), accept)
+
+        with self._observable_mutex:
+            for kind in subscription.kinds or (None,):
+                self._subscriptions[kind] = \
+                    self._subscriptions.get(kind, ()) + (subscription,)
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._observable_mutex:
+            for kind in subscription.kinds or (None,):
+                self._subscriptions[kind] = tuple(s
+                    for s in self._subscriptions.get(kind, ())
+                    if s is not subscription)
+
+    def count_subscribers(self):
+        with self._observable_mutex:
+            return len(set(s for subscriptions in self._subscriptions.values()
+                for s in subscriptions))
+
+    # returns the number of subscribers the event was delivered to
+    def publish(self, kind, data=None):
+        event = Event(kind, self, data)
+
+        with self._observable_mutex:
+            subscriptions = self._subscriptions.get(kind, ()) \
+                + self._subscriptions.get(None, ())
+
+        delivered = 0
+        for subscription in subscriptions:
+            callback = subscription.callback
+            if callback is None:
+                self.unsubscribe(subscription)
+            elif subscription.accept is None or subscription.accept(event):
+                callback(event)
+                delivered += 1
+
+        return delivered
@@ -0,0 +1,97 @@
+# Copyright (c) 2015, Bartlomiej Puget <larhard@gmail.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#   * Neither the name of the Bartlomiej Puget nor the names of its
+#     contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL BARTLOMIEJ PUGET BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gc
+import unittest
+
+from utils.observable import Observable
+
+
+class Listener:
+    def __init__(self):
+        self.events = []
+
+    def wake(self, event):
+        self.events.append(event)
+
+
+class TestObservable(unittest.TestCase):
+    def test_publish_to_kinds(self):
+        observable = Observable()
+        selected = Listener()
+        every = Listener()
+        observable.subscribe(selected.wake, ('a',))
+        observable.subscribe(every.wake)
+
+        self.assertEqual(observable.publish('a', 1), 2)
+        self.assertEqual(observable.publish('b', 2), 1)
+
+        self.assertEqual([(e.kind, e.data) for e in selected.events],
+                [('a', 1)])
+        self.assertEqual([(e.kind, e.data) for e in every.events],
+                [('a', 1), ('b', 2)])
+        self.assertIs(every.events[0].source, observable)
+
+    def test_accept_filters_events(self):
+        observable = Observable()
+        listener = Listener()
+        observable.subscribe(listener.wake, ('a',),
+                lambda event: event.data > 1)
+
+        self.assertEqual(observable.publish('a', 1), 0)
+        self.assertEqual(observable.publish('a', 2), 1)
+        self.assertEqual([e.data for e in listener.events], [2])
+
+    def test_unsubscribe(self):
+        observable = Observable()
+        listener = Listener()
+        subscription = observable.subscribe(listener.wake, ('a', 'b'))
+        self.assertEqual(observable.count_subscribers(), 1)
+
+        observable.unsubscribe(subscription)
+
+        self.assertEqual(observable.count_subscribers(), 0)
+        self.assertEqual(observable.publish('a'), 0)
+        self.assertEqual(listener.events, [])
+
+    def test_methods_are_referenced_weakly(self):
+        observable = Observable()
+        observable.subscribe(Listener().wake)
+        gc.collect()
+
+        self.assertEqual(observable.publish('a'), 0)
+        self.assertEqual(observable.count_subscribers(), 0)
+
+    def test_functions_are_kept(self):
+        observable = Observable()
+        events = []
+        observable.subscribe(lambda event: events.append(event))
+        gc.collect()
+
+        self.assertEqual(observable.publish('a'), 1)
+        self.assertEqual(len(events), 1)